@@ -1,4 +1,5 @@
 from mpxpy.mathpix_client import MathpixClient
+from mpxpy.async_client import MathpixAsyncClient
 from mpxpy.file import File
 from mpxpy.file_job import FileJob, FileSubmission
 from mpxpy.data_source import DataSource
@@ -18,6 +19,7 @@ from mpxpy.errors import (
 
 __all__ = [
     "MathpixClient",
+    "MathpixAsyncClient",
     "File",
     "FileJob",
     "FileSubmission",
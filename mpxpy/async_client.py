@@ -0,0 +1,200 @@
+import asyncio
+import inspect
+import os
+from typing import Any, Callable, Dict, Optional, TypeVar, TYPE_CHECKING
+from mpxpy.mathpix_client import MathpixClient, _open_upload
+from mpxpy.pdf import Pdf
+from mpxpy.conversion import Conversion
+from mpxpy.logger import logger
+from mpxpy.errors import MathpixClientError
+from mpxpy.request_handler import encode_json
+from mpxpy.async_request_handler import (
+    post_json,
+    request_kwargs as async_request_kwargs,
+    require_aiohttp,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_Method = TypeVar('_Method', bound=Callable[..., Any])
+
+
+def _defaults_of(method: Callable[..., Any]) -> Dict[str, Any]:
+    """Return the default of every MathpixClient method argument that has one.
+
+    Read once at import, so the async methods fill in the same defaults as the
+    methods they mirror without declaring them a second time.
+    """
+    return {
+        name: parameter.default
+        for name, parameter in inspect.signature(method).parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+
+
+def _with_signature_of(method: Callable[..., Any]) -> Callable[[_Method], _Method]:
+    """Give a coroutine the signature of the MathpixClient method it mirrors.
+
+    help() and signature-aware editors then list every argument and default.
+    Arguments the coroutine only takes through **kwargs are shown as keyword-only.
+    """
+    def decorate(coroutine: _Method) -> _Method:
+        named = inspect.signature(coroutine).parameters
+        signature = inspect.signature(method)
+        coroutine.__signature__ = signature.replace(parameters=[
+            parameter if parameter.name in named else parameter.replace(kind=inspect.Parameter.KEYWORD_ONLY)
+            for parameter in signature.parameters.values()
+        ])
+        return coroutine
+    return decorate
+
+
+_PDF_NEW_DEFAULTS: Dict[str, Any] = _defaults_of(MathpixClient.pdf_new)
+_CONVERSION_NEW_DEFAULTS: Dict[str, Any] = _defaults_of(MathpixClient.conversion_new)
+
+
+class MathpixAsyncClient:
+    """Async client for submitting many PDFs and conversions concurrently.
+
+    Requests share one aiohttp session, so many uploads can be in flight at once
+    on a single event loop:
+
+        async with MathpixAsyncClient() as client:
+            pdfs = await asyncio.gather(*(client.pdf_new(file_path=path) for path in paths))
+
+    Methods accept the same arguments as the matching MathpixClient methods and
+    return the same Pdf and Conversion objects. Requires the optional aiohttp
+    dependency (pip install "mpxpy[async]").
+
+    Attributes:
+        auth: An Auth instance managing API credentials and endpoints.
+    """
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        app_key: Optional[str] = None,
+        api_url: Optional[str] = None,
+        improve_mathpix: bool = True,
+        request_options: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize a new async Mathpix client.
+
+        Args:
+            app_id: Optional Mathpix application ID. If None, will use environment variable.
+            app_key: Optional Mathpix application key. If None, will use environment variable.
+            api_url: Optional Mathpix API URL. If None, will use environment variable or default to the production API.
+            improve_mathpix: Optional boolean to enable Mathpix to retain user output. Default is true.
+            request_options: Optional dict of request options. Only 'timeout' and 'verify' apply to async requests.
+
+        Raises:
+            MathpixClientError: If aiohttp is not installed.
+        """
+        require_aiohttp()
+        # Request options are validated and built by the sync client, so both
+        # clients send identical requests
+        self._client = MathpixClient(
+            app_id=app_id,
+            app_key=app_key,
+            api_url=api_url,
+            improve_mathpix=improve_mathpix,
+            request_options=request_options,
+        )
+        self.auth = self._client.auth
+        self.request_options = self._client.request_options
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self) -> "MathpixAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            aiohttp = require_aiohttp()
+            connector = aiohttp.TCPConnector(limit=32, limit_per_host=16, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the client's aiohttp session, if one is open."""
+        session = self._session
+        self._session = None
+        if session is not None and not session.closed:
+            await session.close()
+
+    @_with_signature_of(MathpixClient.pdf_new)
+    async def pdf_new(self, file_path: Optional[str] = None, url: Optional[str] = None, **kwargs: Any) -> Pdf:
+        """Uploads a PDF, document, or ebook from a local file or remote URL and optionally requests conversions.
+
+        Args:
+            file_path: Path to a local PDF file.
+            url: URL of a remote PDF file.
+            **kwargs: Any other MathpixClient.pdf_new argument (e.g. convert_to_docx=True)
+
+        Returns:
+            Pdf: A new Pdf instance
+
+        Raises:
+            ValidationError: If neither file_path nor url, or both file_path and url are provided.
+            FileNotFoundError: If the specified file_path does not exist.
+            MathpixClientError: If aiohttp is not installed or the API request fails.
+            TypeError: If an argument is not one MathpixClient.pdf_new accepts.
+        """
+        arguments = {**_PDF_NEW_DEFAULTS, **kwargs, 'file_path': file_path, 'url': url}
+        options, pdf_kwargs = self._client._prepare_pdf_new(**arguments)
+        endpoint = self._client._pdf_endpoint
+        session = self._get_session()
+        request_kwargs = async_request_kwargs(self.request_options)
+        if file_path:
+            logger.debug("Creating new PDF: path=%s", file_path)
+            # Opening can block on slow or network filesystems, so keep it off the event loop
+            pdf_file = await asyncio.get_running_loop().run_in_executor(None, _open_upload, file_path)
+            with pdf_file:
+                form = require_aiohttp().FormData()
+                form.add_field('options_json', encode_json(options).decode())
+                form.add_field('file', pdf_file, filename=os.path.basename(file_path))
+                response_json = await post_json(session, endpoint, data=form, headers=self.auth.headers, raise_for_status=True, **request_kwargs)
+        else:
+            logger.debug("Creating new PDF: url=%s", url)
+            response_json = await post_json(session, endpoint, json=options, headers=self.auth.headers, raise_for_status=True, **request_kwargs)
+        if not isinstance(response_json, dict) or 'pdf_id' not in response_json:
+            logger.error(f"PDF upload failed: {response_json}")
+            raise MathpixClientError(f"Mathpix PDF request failed: {response_json}")
+        pdf_id = response_json['pdf_id']
+        logger.debug("PDF processing started, PDF ID: %s", pdf_id)
+        return Pdf(auth=self.auth, pdf_id=pdf_id, **pdf_kwargs)
+
+    @_with_signature_of(MathpixClient.conversion_new)
+    async def conversion_new(self, mmd: str, **kwargs: Any) -> Conversion:
+        """Converts Mathpix Markdown (MMD) to various output formats.
+
+        Args:
+            mmd: Mathpix Markdown content to convert.
+            **kwargs: Any other MathpixClient.conversion_new argument (e.g. convert_to_docx=True)
+
+        Returns:
+            Conversion: A new Conversion instance.
+
+        Raises:
+            ValidationError: If no output format is requested.
+            MathpixClientError: If aiohttp is not installed or the API request fails.
+            TypeError: If an argument is not one MathpixClient.conversion_new accepts.
+        """
+        logger.debug("Starting new MMD conversion")
+        arguments = {**_CONVERSION_NEW_DEFAULTS, **kwargs, 'mmd': mmd}
+        options, conversion_kwargs = self._client._prepare_conversion_new(**arguments)
+        endpoint = self._client._converter_endpoint
+        # mmd can be large, so serialize it with encode_json rather than aiohttp's json.dumps
+        body, headers = self._client._encode_conversion_body(options)
+        response_json = await post_json(
+            self._get_session(), endpoint, data=body, headers=headers, raise_for_status=True,
+            **async_request_kwargs(self.request_options),
+        )
+        if not isinstance(response_json, dict) or 'error' in response_json or 'conversion_id' not in response_json:
+            logger.error(f"Conversion failed: {response_json}")
+            raise MathpixClientError(f"Conversion failed: {response_json}")
+        conversion_id = response_json['conversion_id']
+        logger.debug("Conversion created, ID: %s", conversion_id)
+        return Conversion(auth=self.auth, conversion_id=conversion_id, **conversion_kwargs)
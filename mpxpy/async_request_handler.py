@@ -0,0 +1,142 @@
+import asyncio
+from types import ModuleType
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from mpxpy import http_client
+from mpxpy.errors import MathpixClientError
+from mpxpy.logger import logger
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+def _import_aiohttp() -> Optional[ModuleType]:
+    """Import aiohttp on first use, returning None if it isn't installed.
+
+    aiohttp is an optional dependency (installed with mpxpy[async]) that takes
+    longer to import than the rest of mpxpy, so sync-only users never load it.
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        return None
+    return aiohttp
+
+
+def require_aiohttp() -> ModuleType:
+    """Return the aiohttp module, raising a helpful error if it is missing."""
+    aiohttp = _import_aiohttp()
+    if aiohttp is None:
+        raise MathpixClientError('Async requests require aiohttp. Install it with: pip install "mpxpy[async]"')
+    return aiohttp
+
+
+def create_session() -> "aiohttp.ClientSession":
+    """Create an aiohttp session with a connection pool sized for concurrent polling.
+
+    With MPXPY_HTTPX=1, an HTTP/2 httpx.AsyncClient is created instead.
+    Must be called from within a running event loop.
+    """
+    if http_client.is_enabled():
+        return http_client.create_async_client()
+    aiohttp = require_aiohttp()
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=32))
+
+
+def is_session_closed(session: "aiohttp.ClientSession") -> bool:
+    """Return True if an aiohttp session or httpx.AsyncClient has been closed."""
+    if http_client.is_async_client(session):
+        return session.is_closed
+    return session.closed
+
+
+async def close_session(session: "aiohttp.ClientSession") -> None:
+    """Close an aiohttp session or httpx.AsyncClient."""
+    if http_client.is_async_client(session):
+        await session.aclose()
+    else:
+        await session.close()
+
+
+def request_kwargs(request_options: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate requests-style request_options into their aiohttp equivalents.
+
+    Only 'timeout' and 'verify' have aiohttp counterparts; other options are ignored.
+    """
+    kwargs: Dict[str, Any] = {}
+    aiohttp = _import_aiohttp()
+    for key, value in request_options.items():
+        if key == 'timeout':
+            total = value[-1] if isinstance(value, tuple) else value
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=total) if aiohttp is not None else total
+        elif key == 'verify':
+            if value is False:
+                kwargs['ssl'] = False
+        else:
+            logger.debug(f"Request option '{key}' is not supported for async requests and will be ignored")
+    return kwargs
+
+
+async def make_request(session: "aiohttp.ClientSession", method: str, url: str, **kwargs: Any) -> Any:
+    """
+    Make an async HTTP request and decode its JSON body, with standardized error handling.
+
+    Args:
+        session: The aiohttp.ClientSession (or httpx.AsyncClient) to send the request through
+        method: HTTP method (GET, POST, etc.)
+        url: The URL to request
+        **kwargs: Additional arguments to pass to aiohttp
+
+    Returns:
+        The decoded JSON response body
+
+    Raises:
+        MathpixClientError: For any request-related failures
+    """
+    if http_client.is_async_client(session):
+        return await _make_httpx_request(session, method, url, **kwargs)
+    aiohttp = require_aiohttp()
+    try:
+        async with session.request(method, url, **kwargs) as response:
+            return await response.json(content_type=None)
+    except asyncio.TimeoutError as e:
+        error_msg = f"Request timed out: {str(e)}"
+        logger.error(error_msg)
+        raise MathpixClientError(error_msg)
+    except aiohttp.ClientConnectionError as e:
+        error_msg = f"Connection error: {str(e)}"
+        logger.error(error_msg)
+        raise MathpixClientError(error_msg)
+    except aiohttp.ClientError as e:
+        error_msg = f"Request error: {str(e)}"
+        logger.error(error_msg)
+        raise MathpixClientError(error_msg)
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+        logger.error(error_msg)
+        raise MathpixClientError(error_msg)
+
+
+async def _make_httpx_request(session: Any, method: str, url: str, **kwargs: Any) -> Any:
+    httpx = http_client.require_httpx()
+    try:
+        return await http_client.async_request_json(session, method, url, **kwargs)
+    except httpx.TimeoutException as e:
+        error_msg = f"Request timed out: {str(e)}"
+        logger.error(error_msg)
+        raise MathpixClientError(error_msg)
+    except httpx.TransportError as e:
+        error_msg = f"Connection error: {str(e)}"
+        logger.error(error_msg)
+        raise MathpixClientError(error_msg)
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+        logger.error(error_msg)
+        raise MathpixClientError(error_msg)
+
+
+async def get_json(session: "aiohttp.ClientSession", url: str, **kwargs: Any) -> Any:
+    return await make_request(session, 'GET', url, **kwargs)
+
+
+async def post_json(session: "aiohttp.ClientSession", url: str, **kwargs: Any) -> Any:
+    return await make_request(session, 'POST', url, **kwargs)
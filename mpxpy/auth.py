@@ -2,6 +2,9 @@ import os
 import pathlib
 import urllib.parse
 from importlib.metadata import version, PackageNotFoundError
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from typing import Optional
 from mpxpy.logger import logger
@@ -28,6 +31,7 @@ class Auth:
         api_url: The base URL for the Mathpix API.
         files_api_url: The base URL for files-api v1 endpoints (internal, defaults to api_url).
         headers: Dictionary of HTTP headers to use for API requests.
+        session: Shared requests.Session that reuses keep-alive connections to the API.
     """
     def __init__(
         self,
@@ -76,6 +80,26 @@ class Auth:
             'app_key': self.app_key,
             'User-Agent': USER_AGENT,
         }
+        self.session = self._create_session()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Build the shared HTTP session.
+
+        Reusing one session keeps TCP/TLS connections to the API alive between
+        requests, so polling loops and repeated uploads don't pay a new handshake
+        on every call. The pool holds enough connections for many threads sharing
+        one client. Idempotent requests are retried on connection errors and
+        429/500/502/503/504 responses. It is created up front rather than on first
+        use so threads sharing one Auth never race to build their own.
+        """
+        retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+        session = requests.Session()
+        session.headers['Connection'] = 'keep-alive'
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def load_config(self):
         """
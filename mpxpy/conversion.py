@@ -1,12 +1,79 @@
+import asyncio
+import logging
 import os
+import random
 import time
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Dict, Any, List, Set, Union, TYPE_CHECKING
 from urllib.parse import urljoin
 from mpxpy.auth import Auth
 from mpxpy.logger import logger
-from mpxpy.request_handler import get
+from mpxpy.request_handler import get, response_json, write_response_to_file
+from mpxpy.async_request_handler import create_session, get_json as async_get_json, request_kwargs as async_request_kwargs
 from mpxpy.errors import FilesystemError, ValidationError, ConversionIncompleteError
 
+if TYPE_CHECKING:
+    import aiohttp
+
+# Status polling starts with a burst of fast polls so short conversions are picked
+# up almost immediately, then ramps up geometrically to a capped interval so long
+# conversions don't hammer the API. Jitter keeps many concurrent pollers from
+# synchronizing their requests.
+_POLL_FAST_ATTEMPTS = 10
+_POLL_FAST_DELAY = 0.1
+_POLL_RAMP_UNTIL = 20.0
+_POLL_PLATEAU_DELAY = 5.0
+_POLL_JITTER_RATIO = 0.15
+
+# conversion_status() reuses a response this recent, so reading the status right
+# after wait_until_complete returns, or several times within one tick, costs a
+# single request.
+_STATUS_CACHE_TTL = 0.5
+
+# Per-format statuses after which a format will not change again
+_TERMINAL_FORMAT_STATUSES = frozenset({'completed', 'error'})
+
+# Maximum number of on_format_ready callbacks run at once by wait_until_complete
+_FORMAT_READY_WORKERS = 4
+
+
+def _poll_delay(attempts: int, elapsed: float) -> float:
+    """Return the number of seconds to sleep before the next status poll.
+
+    Args:
+        attempts: Number of status polls made so far.
+        elapsed: Seconds elapsed since polling started.
+    """
+    if attempts < _POLL_FAST_ATTEMPTS:
+        delay = _POLL_FAST_DELAY
+    elif elapsed < _POLL_RAMP_UNTIL:
+        ramp = (elapsed / _POLL_RAMP_UNTIL) ** 0.7
+        delay = _POLL_FAST_DELAY * (_POLL_PLATEAU_DELAY / _POLL_FAST_DELAY) ** ramp
+    else:
+        delay = _POLL_PLATEAU_DELAY
+    return delay * random.uniform(1 - _POLL_JITTER_RATIO, 1 + _POLL_JITTER_RATIO)
+
+
+def _is_completed(conversion_status: Dict[str, Any], requested_formats: List[str]) -> bool:
+    """Return True if the conversion and every requested format have finished.
+
+    The top-level status can lag behind the per-format statuses, so once every
+    requested format has completed the conversion counts as complete regardless,
+    unless the conversion itself has failed.
+    """
+    if conversion_status['status'] == 'error':
+        return False
+    format_statuses = conversion_status.get('conversion_status') or {}
+    if requested_formats and all(
+        format_statuses.get(conversion_format, {}).get('status') == 'completed'
+        for conversion_format in requested_formats
+    ):
+        return True
+    return conversion_status['status'] == 'completed' and all(
+        format_data['status'] in _TERMINAL_FORMAT_STATUSES
+        for format_data in conversion_status['conversion_status'].values()
+    )
+
 
 class Conversion:
     """Manages a Mathpix conversion through the v3/converter endpoint.
@@ -82,61 +149,217 @@ class Conversion:
         self.convert_to_pptx = convert_to_pptx
         self.convert_to_html_zip = convert_to_html_zip
         self.request_options = request_options or {}
-
-    def wait_until_complete(self, timeout: int=60):
+        self._requested_formats: List[str] = [
+            conversion_format for conversion_format, is_requested in (
+                ('docx', convert_to_docx),
+                ('md', convert_to_md),
+                ('tex.zip', convert_to_tex_zip),
+                ('html', convert_to_html),
+                ('pdf', convert_to_pdf),
+                ('latex.pdf', convert_to_latex_pdf),
+                ('md.zip', convert_to_md_zip),
+                ('mmd.zip', convert_to_mmd_zip),
+                ('pptx', convert_to_pptx),
+                ('html.zip', convert_to_html_zip),
+            ) if is_requested
+        ]
+        self._completed_formats: Set[str] = set()
+        # Built once since every status poll and download goes through it
+        self._converter_url = urljoin(self.auth.api_url, f'v3/converter/{self.conversion_id}')
+        self._last_status: Optional[Dict[str, Any]] = None
+        self._last_status_at = 0.0
+        self._last_status_etag: Optional[str] = None
+
+    def wait_until_complete(self, timeout: int=60, on_format_ready: Optional[Callable[[str], None]] = None):
         """Wait for the conversion to complete.
 
         Polls the conversion status until it's complete or the timeout is reached.
+        Polls are frequent at first and back off to one every few seconds for
+        long-running conversions.
+
+        Args:
+            timeout: Maximum number of seconds to wait. Must be a positive, non-zero integer.
+            on_format_ready: Optional callback called with the format name (e.g. 'docx') as
+                soon as each format completes, so downloads can start while other formats
+                are still converting. Callbacks run on a thread pool and have all finished
+                when this method returns. Each format is reported once per Conversion.
+
+        Returns:
+            bool: True if the conversion completed successfully, False if it timed out.
+
+        Raises:
+            ValidationError: If timeout is an invalid value
+        """
+        if not isinstance(timeout, int) or timeout <= 0:
+            raise ValidationError("Timeout must be a positive, non-zero integer")
+        logger.debug(f"Waiting for conversion {self.conversion_id} to complete (timeout: {timeout}s)")
+        # Bound once, outside the loop, for long polls
+        monotonic, sleep = time.monotonic, time.sleep
+        is_debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        start = monotonic()
+        deadline = start + timeout
+        attempts = 0
+        completed = False
+        executor = ThreadPoolExecutor(max_workers=_FORMAT_READY_WORKERS) if on_format_ready else None
+        callbacks = []
+        try:
+            while monotonic() < deadline:
+                attempts += 1
+                if is_debug_enabled:
+                    logger.debug('Checking conversion status... (attempt %d)', attempts)
+                conversion_status = self._fetch_conversion_status()
+                for conversion_format in self._record_completed_formats(conversion_status):
+                    if executor is not None:
+                        callbacks.append(executor.submit(on_format_ready, conversion_format))
+                if _is_completed(conversion_status, self._requested_formats):
+                    completed = True
+                    logger.debug(f"Conversion {self.conversion_id} completed successfully")
+                    break
+                elif conversion_status['status'] == 'error':
+                    break
+                now = monotonic()
+                sleep(min(_poll_delay(attempts, now - start), max(0.0, deadline - now)))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        for callback in callbacks:
+            callback.result()
+        if not completed:
+            logger.warning(f"Conversion {self.conversion_id} did not complete within timeout period ({timeout}s)")
+        return completed
+
+    async def wait_until_complete_async(self, timeout: int=60, session: Optional["aiohttp.ClientSession"] = None):
+        """Wait for the conversion to complete without blocking a thread.
+
+        Coroutine version of wait_until_complete, so many conversions can be awaited
+        concurrently on a single event loop. Pass them one shared session so all the
+        polls reuse the same connection pool:
+
+            async with create_session() as session:
+                results = await asyncio.gather(*(c.wait_until_complete_async(session=session) for c in conversions))
+
+        Requires the optional aiohttp dependency (pip install "mpxpy[async]").
 
         Args:
             timeout: Maximum number of seconds to wait. Must be a positive, non-zero integer.
+            session: Optional aiohttp.ClientSession to poll with, e.g. one shared by many
+                conversions. If None, a session is opened for this call and closed when it
+                returns, which costs a new connection (and TLS handshake) per call.
 
         Returns:
             bool: True if the conversion completed successfully, False if it timed out.
 
         Raises:
             ValidationError: If timeout is an invalid value
+            MathpixClientError: If aiohttp is not installed or a status request fails.
         """
         if not isinstance(timeout, int) or timeout <= 0:
             raise ValidationError("Timeout must be a positive, non-zero integer")
+        if session is None:
+            async with create_session() as session:
+                return await self._wait_until_complete_async(timeout, session)
+        return await self._wait_until_complete_async(timeout, session)
+
+    async def _wait_until_complete_async(self, timeout: int, session: "aiohttp.ClientSession") -> bool:
         logger.debug(f"Waiting for conversion {self.conversion_id} to complete (timeout: {timeout}s)")
-        attempt = 1
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        deadline = start + timeout
+        attempts = 0
         completed = False
-        while attempt < timeout and not completed:
-            logger.debug(f'Checking conversion status... ({attempt}/{timeout})')
-            conversion_status = self.conversion_status()
-            if (conversion_status['status'] == 'completed' and all(
-                    format_data['status'] == 'completed' or format_data['status'] == 'error'
-                    for _, format_data in conversion_status['conversion_status'].items()
-            )):
+        is_debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        while loop.time() < deadline:
+            attempts += 1
+            if is_debug_enabled:
+                logger.debug('Checking conversion status... (attempt %d)', attempts)
+            conversion_status = await self.conversion_status_async(session=session)
+            if _is_completed(conversion_status, self._requested_formats):
                 completed = True
                 logger.debug(f"Conversion {self.conversion_id} completed successfully")
                 break
             elif conversion_status['status'] == 'error':
                 break
-            time.sleep(1)
-            attempt += 1
+            now = loop.time()
+            await asyncio.sleep(min(_poll_delay(attempts, now - start), max(0.0, deadline - now)))
         if not completed:
             logger.warning(f"Conversion {self.conversion_id} did not complete within timeout period ({timeout}s)")
         return completed
 
+    async def conversion_status_async(self, session: Optional["aiohttp.ClientSession"] = None):
+        """Get the current status of the conversion without blocking a thread.
+
+        Args:
+            session: Optional aiohttp.ClientSession to send the request with. If None,
+                a session is opened for this request and closed when it returns, which
+                costs a new connection (and TLS handshake) per call.
+
+        Returns:
+            dict: JSON response containing conversion status information.
+        """
+        if session is None:
+            async with create_session() as session:
+                return await self.conversion_status_async(session=session)
+        logger.debug(f"Getting status for conversion {self.conversion_id}")
+        endpoint = self._converter_url
+        conversion_status = await async_get_json(session, endpoint, headers=self.auth.headers, **async_request_kwargs(self.request_options))
+        return self._cache_status(conversion_status)
+
     def conversion_status(self):
         """Get the current status of the conversion.
 
+        A status fetched less than half a second ago (including by wait_until_complete)
+        is returned without making a new request.
+
         Returns:
             dict: JSON response containing conversion status information.
         """
-        logger.debug(f"Getting status for conversion {self.conversion_id}")
-        endpoint = urljoin(self.auth.api_url, f'v3/converter/{self.conversion_id}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
-        return response.json()
+        is_cache_fresh = self._last_status is not None and time.monotonic() - self._last_status_at < _STATUS_CACHE_TTL
+        if is_cache_fresh:
+            return self._last_status
+        return self._fetch_conversion_status()
+
+    def _fetch_conversion_status(self) -> Dict[str, Any]:
+        """Request the current status of the conversion and cache the response.
 
-    def save_file(self, path: str, conversion_format: str) -> str:
+        If the previous response carried an ETag, the request is made conditional
+        so an unchanged status comes back as an empty 304 and is not decoded again.
+        """
+        logger.debug(f"Getting status for conversion {self.conversion_id}")
+        endpoint = self._converter_url
+        headers = self.auth.headers
+        if self._last_status_etag is not None:
+            headers = {**headers, 'If-None-Match': self._last_status_etag}
+        response = get(endpoint, headers=headers, session=self.auth.session, **self.request_options)
+        if response.status_code == 304 and self._last_status is not None:
+            return self._cache_status(self._last_status)
+        self._last_status_etag = response.headers.get('ETag')
+        return self._cache_status(response_json(response))
+
+    def _record_completed_formats(self, conversion_status: Dict[str, Any]) -> List[str]:
+        """Record formats that have completed, returning those not seen completed before."""
+        newly_completed = [
+            conversion_format
+            for conversion_format, format_data in (conversion_status.get('conversion_status') or {}).items()
+            if format_data['status'] == 'completed' and conversion_format not in self._completed_formats
+        ]
+        self._completed_formats.update(newly_completed)
+        return newly_completed
+
+    def _cache_status(self, conversion_status: Dict[str, Any]) -> Dict[str, Any]:
+        self._last_status = conversion_status
+        self._last_status_at = time.monotonic()
+        return conversion_status
+
+    def save_file(self, path: str, conversion_format: str, direct_io: bool = False, preallocate: bool = False) -> str:
         """Helper function to save the processed conversion result to a local path.
 
         Args:
             path: The local file path where the output will be saved
             conversion_format: The format in which the output will be saved
+            direct_io: Optional boolean to write with O_DIRECT, bypassing the page cache.
+                Useful for very large outputs; ignored where O_DIRECT is unavailable.
+            preallocate: Optional boolean to reserve disk space for the whole file before writing.
+                Only worthwhile on local filesystems with native fallocate support; ignored elsewhere.
 
         Returns:
             output_path: The path of the saved Markdown file
@@ -148,18 +371,16 @@ class Conversion:
             filename = f"{self.conversion_id}.{conversion_format}"
             path = os.path.join(path, filename)
         logger.debug(f"Downloading output for Conversion {self.conversion_id} in format {conversion_format} to path {path}")
-        endpoint = urljoin(self.auth.api_url, f'v3/converter/{self.conversion_id}.{conversion_format}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        endpoint = f'{self._converter_url}.{conversion_format}'
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, stream=True, **self.request_options)
         if response.status_code == 404:
+            response.close()
             raise ConversionIncompleteError("Conversion not complete")
         try:
             directory = os.path.dirname(path)
             if directory:
                 os.makedirs(directory, exist_ok=True)
-            with open(path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            write_response_to_file(response, path, direct_io=direct_io, preallocate=preallocate)
         except Exception:
             raise FilesystemError('Failed to save file to system')
         logger.debug(f"File saved successfully to {path}")
@@ -178,8 +399,8 @@ class Conversion:
             ConversionIncompleteError: If the conversion is not complete
         """
         logger.debug(f"Downloading output for conversion {self.conversion_id} in format: {conversion_format}")
-        endpoint = urljoin(self.auth.api_url, f'v3/converter/{self.conversion_id}.{conversion_format}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        endpoint = f'{self._converter_url}.{conversion_format}'
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         if response.status_code == 404:
             raise ConversionIncompleteError("Conversion not complete")
         return response.text
@@ -197,12 +418,47 @@ class Conversion:
             ConversionIncompleteError: If the conversion is not complete
         """
         logger.debug(f"Downloading output for conversion {self.conversion_id} in format: {conversion_format}")
-        endpoint = urljoin(self.auth.api_url, f'v3/converter/{self.conversion_id}.{conversion_format}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        endpoint = f'{self._converter_url}.{conversion_format}'
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         if response.status_code == 404:
             raise ConversionIncompleteError("Conversion not complete")
         return response.content
 
+    def download_outputs(self, formats: List[str], max_workers: int = 4, path: Optional[str] = None) -> Dict[str, Union[str, bytes]]:
+        """Download several output formats of the conversion concurrently.
+
+        The downloads run on a thread pool and share the pooled session held on auth,
+        so fetching N formats takes about as long as the slowest one.
+
+        Args:
+            formats: Output format extensions to download (e.g. ['docx', 'tex.zip', 'pdf'])
+            max_workers: Maximum number of downloads to run at once
+            path: Optional directory to save the files to, named {conversion_id}.{format}.
+                If omitted, the results are returned as bytes.
+
+        Returns:
+            dict: Maps each format to the path of the saved file, or to its bytes if no path was given
+
+        Raises:
+            ValidationError: If max_workers is an invalid value
+            ConversionIncompleteError: If the conversion is not complete
+        """
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ValidationError("max_workers must be a positive, non-zero integer")
+        if path is not None:
+            path = os.path.join(path, '')
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                conversion_format: executor.submit(self._download_one, conversion_format, path)
+                for conversion_format in formats
+            }
+        return {conversion_format: future.result() for conversion_format, future in futures.items()}
+
+    def _download_one(self, conversion_format: str, path: Optional[str]) -> Union[str, bytes]:
+        if path is None:
+            return self.bytes_result(conversion_format)
+        return self.save_file(path=path, conversion_format=conversion_format)
+
     def to_docx_file(self, path: str) -> str:
         """Save the processed conversion result to a DOCX file at a local path.
 
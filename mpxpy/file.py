@@ -6,7 +6,7 @@ from urllib.parse import urljoin
 import requests
 from mpxpy.auth import Auth
 from mpxpy.logger import logger
-from mpxpy.request_handler import get, delete
+from mpxpy.request_handler import get, delete, write_response_to_file
 from mpxpy.errors import (
     FilesystemError,
     ValidationError,
@@ -211,7 +211,7 @@ class File:
         """
         logger.debug(f"Getting status for file {self.file_id}")
         endpoint: str = urljoin(self.auth.files_api_url, f'/files/v1/{self.file_id}')
-        response: requests.Response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response: requests.Response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         has_failed: bool = not response.ok
         if has_failed:
             raise error_from_response(response)
@@ -236,7 +236,7 @@ class File:
         """
         logger.debug(f"Deleting file {self.file_id}")
         endpoint: str = urljoin(self.auth.files_api_url, f'/files/v1/{self.file_id}')
-        response: requests.Response = delete(endpoint, headers=self.auth.headers, **self.request_options)
+        response: requests.Response = delete(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         has_failed: bool = not response.ok
         if has_failed:
             raise error_from_response(response)
@@ -287,16 +287,13 @@ class File:
             path = os.path.join(path, filename)
         logger.debug(f"Downloading output for file {self.file_id} in format {conversion_format} to path {path}")
         endpoint: str = urljoin(self.auth.files_api_url, f'/files/v1/{self.file_id}.{conversion_format}')
-        response: requests.Response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response: requests.Response = get(endpoint, headers=self.auth.headers, session=self.auth.session, stream=True, **self.request_options)
         self._check_download_response(response)
         try:
             directory: str = os.path.dirname(path)
             if directory:
                 os.makedirs(directory, exist_ok=True)
-            with open(path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            write_response_to_file(response, path)
         except Exception:
             raise FilesystemError('Failed to save file to system')
         logger.debug(f"File saved successfully to {path}")
@@ -316,7 +313,7 @@ class File:
         """
         logger.debug(f"Downloading output for file {self.file_id} in format: {conversion_format}")
         endpoint: str = urljoin(self.auth.files_api_url, f'/files/v1/{self.file_id}.{conversion_format}')
-        response: requests.Response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response: requests.Response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         self._check_download_response(response)
         return response.text
 
@@ -334,7 +331,7 @@ class File:
         """
         logger.debug(f"Downloading output for file {self.file_id} in format: {conversion_format}")
         endpoint: str = urljoin(self.auth.files_api_url, f'/files/v1/{self.file_id}.{conversion_format}')
-        response: requests.Response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response: requests.Response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         self._check_download_response(response)
         return response.content
 
@@ -352,7 +349,7 @@ class File:
         """
         logger.debug(f"Downloading output for file {self.file_id} in format: {conversion_format}")
         endpoint: str = urljoin(self.auth.files_api_url, f'/files/v1/{self.file_id}.{conversion_format}')
-        response: requests.Response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response: requests.Response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         self._check_download_response(response)
         return json.loads(response.text)
 
@@ -1,5 +1,6 @@
 import time
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator
 from pydantic import BaseModel
 from urllib.parse import urljoin
 from mpxpy.pdf import Pdf
@@ -7,6 +8,9 @@ from mpxpy.auth import Auth
 from mpxpy.logger import logger
 from mpxpy.request_handler import get
 
+# A batch status fetched within this many seconds is reused instead of requested again
+_STATUS_CACHE_TTL = 0.5
+
 class FilesResponse(BaseModel):
     files: List[Pdf]
     cursor: str
@@ -49,6 +53,11 @@ class FileBatch:
             logger.error("FileBatch requires a File Batch ID")
             raise ValueError("FileBatch requires a File Batch ID")
         self.request_options = request_options or {}
+        # Built once, since wait_until_complete polls the status endpoint every second
+        self._status_endpoint = urljoin(self.auth.api_url, f'v3/file-batches/{self.file_batch_id}')
+        self._files_endpoint = urljoin(self.auth.api_url, f'v3/file-batches/{self.file_batch_id}/files')
+        self._last_status: Optional[Dict[str, Any]] = None
+        self._last_status_at = 0.0
 
     def file_batch_is_processing(self):
         """Check if the file batch is still being processed.
@@ -58,9 +67,7 @@ class FileBatch:
                  files are either completed or have errored out.
         """
         logger.debug(f"Checking if file batch {self.file_batch_id} is still processing")
-        endpoint = urljoin(self.auth.api_url, f'v3/file-batches/{self.file_batch_id}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
-        response_json = response.json()
+        response_json = self.file_batch_status()
         total_files = response_json["total_files"]
         completed_files = response_json["completed_files"]
         error_files = response_json["error_files"]
@@ -71,14 +78,25 @@ class FileBatch:
     def file_batch_status(self):
         """Get the current status of the file batch.
 
+        A status fetched less than half a second ago (including by wait_until_complete
+        or file_batch_is_processing) is returned without making a new request.
+
         Returns:
             dict: JSON response containing batch status information including counts
                  of total, completed, and error files.
         """
+        is_cache_fresh = self._last_status is not None and time.monotonic() - self._last_status_at < _STATUS_CACHE_TTL
+        if is_cache_fresh:
+            return self._last_status
+        return self._fetch_file_batch_status()
+
+    def _fetch_file_batch_status(self) -> Dict[str, Any]:
+        """Request the current status of the file batch and cache the response."""
         logger.debug(f"Getting status for file batch {self.file_batch_id}")
-        endpoint =  urljoin(self.auth.api_url, f'v3/file-batches/{self.file_batch_id}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
-        return response.json()
+        response = get(self._status_endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
+        self._last_status = response.json()
+        self._last_status_at = time.monotonic()
+        return self._last_status
 
     def files(self, cursor: Optional[str] = None) -> FilesResponse:
         """Retrieve the files in this batch, with pagination support.
@@ -93,18 +111,37 @@ class FileBatch:
                 - has_more (bool): Whether more pages of results are available.
         """
         logger.debug(f"Retrieving files for batch {self.file_batch_id}")
-        endpoint =  urljoin(self.auth.api_url, f'v3/file-batches/{self.file_batch_id}/files')
+        endpoint = self._files_endpoint
         if cursor:
             endpoint += f"?cursor={cursor}"
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         response_json = response.json()
-        files = [Pdf(pdf_id=file) for file in response_json['results']]
+        files = [Pdf(auth=self.auth, pdf_id=file, request_options=self.request_options) for file in response_json['results']]
         return FilesResponse(
             files=files,
             cursor=response_json['cursor'],
             has_more=response_json['has_more']
         )
 
+    def files_iter(self) -> Iterator[FilesResponse]:
+        """Iterate over every page of files in this batch.
+
+        While the caller works through one page, the next page is already being
+        requested in a background thread, so page requests overlap with the
+        caller's processing instead of running between pages.
+
+        Yields:
+            FilesResponse: Each page of files, in order.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = self.files()
+            while True:
+                next_page = executor.submit(self.files, page.cursor) if page.has_more else None
+                yield page
+                if next_page is None:
+                    return
+                page = next_page.result()
+
     def wait_until_complete(self, timeout: int = 60):
         """Wait for all files in the batch to complete processing.
 
@@ -124,7 +161,7 @@ class FileBatch:
         attempts = 1
         completed = False
         while attempts < timeout:
-            file_batch_status = self.file_batch_status()
+            file_batch_status = self._fetch_file_batch_status()
             total = file_batch_status["total_files"]
             completed_count = file_batch_status["completed_files"]
             error_count = file_batch_status["error_files"]
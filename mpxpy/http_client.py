@@ -0,0 +1,181 @@
+"""Optional HTTP/2 transport built on httpx.
+
+Set the MPXPY_HTTPX environment variable to 1 to send API requests through a
+shared httpx client with HTTP/2 enabled. Concurrent status polls and downloads
+are then multiplexed over one connection instead of opening a connection each.
+Requires the optional http2 dependencies (pip install "mpxpy[http2]").
+"""
+import os
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Dict, Iterator, Optional, TYPE_CHECKING
+import requests
+from mpxpy.errors import MathpixClientError
+
+if TYPE_CHECKING:
+    import httpx
+
+# Request arguments with an httpx equivalent. Requests made with any other
+# argument (files, verify, cert, proxies, ...) keep going through requests.
+_SUPPORTED_ARGUMENTS = frozenset({'headers', 'params', 'json', 'data', 'stream', 'timeout', 'allow_redirects'})
+
+_client: Optional["httpx.Client"] = None
+_client_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    """Return True if requests should be sent with httpx (MPXPY_HTTPX=1)."""
+    return os.getenv('MPXPY_HTTPX') == '1'
+
+
+def _import_httpx() -> Optional[ModuleType]:
+    """Import httpx on first use, returning None if it isn't installed.
+
+    httpx is an optional dependency (installed with mpxpy[http2]) that is only
+    needed with MPXPY_HTTPX=1, so importing mpxpy never loads it.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+    return httpx
+
+
+def require_httpx() -> ModuleType:
+    """Return the httpx module, raising a helpful error if it is missing."""
+    httpx = _import_httpx()
+    if httpx is None:
+        raise MathpixClientError('MPXPY_HTTPX=1 requires httpx with HTTP/2 support. Install it with: pip install "mpxpy[http2]"')
+    return httpx
+
+
+def _client_options() -> Dict[str, Any]:
+    httpx = require_httpx()
+    return {
+        'http2': True,
+        'limits': httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        'timeout': httpx.Timeout(30.0, connect=5.0),
+    }
+
+
+def get_client() -> "httpx.Client":
+    """Shared HTTP/2 client, created on first use."""
+    global _client
+    httpx = require_httpx()
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(**_client_options())
+        return _client
+
+
+def create_async_client() -> "httpx.AsyncClient":
+    """Create an HTTP/2 client for async requests, configured like get_client()."""
+    httpx = require_httpx()
+    return httpx.AsyncClient(**_client_options())
+
+
+def is_async_client(session: Any) -> bool:
+    """Return True if session is an httpx.AsyncClient rather than an aiohttp session."""
+    # A session can only be an httpx client once httpx has been imported
+    httpx = sys.modules.get('httpx')
+    return httpx is not None and isinstance(session, httpx.AsyncClient)
+
+
+def supports(kwargs: Dict[str, Any]) -> bool:
+    """Return True if a request with these requests-style arguments can be sent with httpx."""
+    if not _SUPPORTED_ARGUMENTS.issuperset(kwargs):
+        return False
+    data = kwargs.get('data')
+    return data is None or isinstance(data, (bytes, str, dict))
+
+
+def _httpx_arguments(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate requests-style request arguments into httpx ones."""
+    arguments = dict(kwargs)
+    arguments.pop('stream', None)
+    if isinstance(arguments.get('data'), (bytes, str)):
+        arguments['content'] = arguments.pop('data')
+    timeout = arguments.get('timeout')
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        arguments['timeout'] = require_httpx().Timeout(read, connect=connect)
+    elif timeout is not None and not isinstance(timeout, (int, float)):
+        # aiohttp.ClientTimeout from the async request path
+        arguments['timeout'] = timeout.total
+    return arguments
+
+
+def request(method: str, url: str, **kwargs: Any) -> "HttpxResponse":
+    """Send a request with the shared HTTP/2 client.
+
+    httpx errors are raised as the matching requests exceptions, so callers
+    handle failures the same way whichever transport is in use.
+    """
+    stream = kwargs.get('stream', False)
+    arguments = _httpx_arguments(kwargs)
+    # requests follows redirects by default, httpx doesn't
+    follow_redirects = arguments.pop('allow_redirects', True)
+    httpx = require_httpx()
+    client = get_client()
+    try:
+        built = client.build_request(method, url, **arguments)
+        response = client.send(built, stream=stream, follow_redirects=follow_redirects)
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.Timeout(str(e)) from e
+    except httpx.TransportError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+    except httpx.HTTPError as e:
+        raise requests.exceptions.RequestException(str(e)) from e
+    return HttpxResponse(response)
+
+
+async def async_request_json(client: "httpx.AsyncClient", method: str, url: str, **kwargs: Any) -> Any:
+    """Send an async request with an httpx client and decode its JSON body.
+
+    'ssl' is dropped, since httpx sets certificate verification per client.
+    """
+    kwargs.pop('ssl', None)
+    arguments = _httpx_arguments(kwargs)
+    follow_redirects = arguments.pop('allow_redirects', True)
+    response = await client.request(method, url, follow_redirects=follow_redirects, **arguments)
+    return response.json()
+
+
+class HttpxResponse:
+    """An httpx.Response behind the parts of the requests.Response interface mpxpy uses."""
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self.status_code: int = response.status_code
+        self.headers = response.headers
+        self.url: str = str(response.url)
+        self.reason: str = response.reason_phrase
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def content(self) -> bytes:
+        return self._response.read()
+
+    @property
+    def text(self) -> str:
+        self._response.read()
+        return self._response.text
+
+    def json(self, **kwargs: Any) -> Any:
+        self._response.read()
+        return self._response.json(**kwargs)
+
+    def iter_content(self, chunk_size: Optional[int] = 1) -> Iterator[bytes]:
+        return self._response.iter_bytes(chunk_size)
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error: {self.reason} for url: {self.url}", response=self
+            )
+
+    def close(self) -> None:
+        self._response.close()
@@ -5,7 +5,7 @@ from urllib.parse import urljoin
 from mpxpy.auth import Auth
 from mpxpy.logger import logger
 from mpxpy.errors import AuthenticationError, ValidationError, MathpixClientError
-from mpxpy.request_handler import get
+from mpxpy.request_handler import get, response_json
 
 
 class Image:
@@ -74,11 +74,15 @@ class Image:
         self.is_async = is_async
         self.result = result
         self.request_options = request_options or {}
+        # Built once since wait_until_complete polls it
+        self._ocr_results_url = urljoin(self.auth.api_url, f'v3/ocr-results?request_id={self.request_id}')
 
     def results(self):
         """Get OCR results.
 
-        Returns the result, or if it's async, gets the result from ocr-results
+        Returns the result, or if it's async, gets the result from ocr-results.
+        Once the async result is available it is kept, so later calls (including
+        through lines_json, mmd, and the other output helpers) don't request it again.
 
         Returns:
             dict: JSON response containing OCR results, including extracted text and metadata.
@@ -88,17 +92,19 @@ class Image:
         """
         if not self.is_async or 'text' in self.result or 'html' in self.result or 'latex_styled' in self.result or 'lines' in self.result:
             return self.result
+        # An ocr-results entry carries image_id; the initial async response doesn't
+        if 'image_id' in self.result:
+            return self.result
         try:
-            endpoint = urljoin(self.auth.api_url, f'v3/ocr-results?request_id={self.request_id}')
-            response = get(endpoint, headers=self.auth.headers, **self.request_options)
+            response = get(self._ocr_results_url, headers=self.auth.headers, session=self.auth.session, **self.request_options)
             response.raise_for_status()
-            response_json = response.json()
-            if 'ocr_results' in response_json and len(response_json['ocr_results']) > 0:
-                result = response_json['ocr_results'][0]
+            ocr_results = response_json(response)
+            if 'ocr_results' in ocr_results and len(ocr_results['ocr_results']) > 0:
+                result = ocr_results['ocr_results'][0]
                 self.result = result
                 return result
             return {}
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             raise ValueError(f"Mathpix async image result request failed: {e}")
         except Exception as e:
             raise MathpixClientError(f"Mathpix async image result request failed: {e}")
@@ -116,9 +122,7 @@ class Image:
         """
         start_time = time.time()
         while time.time() < start_time + timeout:
-            result = self.results()
-            if 'image_id' in result:
-                self.result = result
+            if 'image_id' in self.results():
                 return True
             time.sleep(1)
         return False
@@ -1,12 +1,12 @@
+import os
 import sys
-import json
 import requests
-from typing import Dict, Any, Optional, List, Set, Tuple, Union
+from types import MappingProxyType
+from typing import BinaryIO, Dict, Any, Mapping, Optional, List, Set, Tuple, Union
 if sys.version_info >= (3, 13):
     from warnings import deprecated
 else:
     from typing_extensions import deprecated
-from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from mpxpy.pdf import Pdf
 from mpxpy.image import Image
@@ -20,7 +20,16 @@ from mpxpy.batch import Batch
 from mpxpy.auth import Auth
 from mpxpy.logger import logger, configure_logging
 from mpxpy.errors import MathpixClientError, ValidationError, error_from_response
-from mpxpy.request_handler import post, get
+from mpxpy.request_handler import (
+    post,
+    get,
+    encode_json,
+    encode_msgpack,
+    multipart_kwargs,
+    require_msgpack,
+    response_json as decode_response_json,
+    response_msgpack,
+)
 
 
 def _apply_processing_options(
@@ -98,6 +107,34 @@ def _redact_uri(uri: Optional[str]) -> str:
     return f"{parsed.scheme}://{parsed.hostname or ''}"
 
 
+# PDFs and ebooks can run to hundreds of megabytes, so their uploads are read
+# from disk in 1 MiB blocks as the streamed request body is sent.
+_PDF_UPLOAD_BUFFER_SIZE = 1 << 20
+
+
+def _open_upload(file_path: str, buffering: int = -1) -> BinaryIO:
+    """Open a local file for upload.
+
+    Opening directly, rather than checking Path.is_file() first, takes one
+    filesystem call instead of two and can't race with the file being removed.
+
+    Args:
+        file_path: Path to the local file
+        buffering: Read buffer size, as for open(). Defaults to the system default.
+
+    Raises:
+        FileNotFoundError: If file_path does not exist or is a directory.
+    """
+    try:
+        return open(file_path, "rb", buffering=buffering)
+    except (FileNotFoundError, IsADirectoryError, PermissionError) as e:
+        # Windows raises PermissionError rather than IsADirectoryError for a directory
+        if isinstance(e, PermissionError) and not os.path.isdir(file_path):
+            raise
+        logger.error(f"File not found: {file_path}")
+        raise FileNotFoundError(f"File path not found: {file_path}")
+
+
 def _reject_reserved_extra_options(
         extra_options: Optional[Dict[str, object]],
         reserved: Set[str],
@@ -145,6 +182,18 @@ _PDF_REQUEST_OPTION_KEYS: Set[str] = {
 
 _CONVERSION_REQUEST_OPTION_KEYS: Set[str] = {'mmd', 'formats', 'conversion_options'}
 
+# Options every pdf_new request starts from. Read-only and shared, so each
+# request copies it rather than rebuilding the defaults.
+_PDF_DEFAULT_OPTIONS: Mapping[str, Any] = MappingProxyType({
+    "math_inline_delimiters": ("$", "$"),
+    "rm_spaces": True,
+})
+
+_REQUEST_ENCODINGS: Tuple[str, ...] = ('json', 'msgpack')
+
+# The production API only accepts JSON request bodies
+_JSON_ONLY_API_HOSTS: Set[str] = {'api.mathpix.com'}
+
 
 class MathpixClient:
     """Client for interacting with the Mathpix API.
@@ -162,7 +211,8 @@ class MathpixClient:
         api_url: Optional[str] = None,
         files_api_url: Optional[str] = None,
         improve_mathpix: bool = True,
-        request_options: Optional[Dict[str, Any]] = None
+        request_options: Optional[Dict[str, Any]] = None,
+        encoding: str = 'json'
     ):
         """Initialize a new Mathpix client.
 
@@ -173,12 +223,32 @@ class MathpixClient:
             files_api_url: Optional files-api URL for internal testing. If None, defaults to api_url.
             improve_mathpix: Optional boolean to enable Mathpix to retain user output. Default is true.
             request_options: Optional dict of keyword arguments to pass to the requests library (e.g. {'verify': False} for SSL verification).
+            encoding: Optional request body encoding for conversion_new, 'json' (default) or 'msgpack'.
+                'msgpack' requires the msgpack extra and an API that accepts it; the production API
+                only accepts JSON, so the client falls back to 'json' there.
+
+        Raises:
+            ValidationError: If encoding is not 'json' or 'msgpack'.
+            MathpixClientError: If encoding is 'msgpack' and msgpack is not installed.
         """
         logger.debug("Initializing MathpixClient")
+        if encoding not in _REQUEST_ENCODINGS:
+            raise ValidationError(f"encoding must be one of {', '.join(_REQUEST_ENCODINGS)}, got {encoding!r}")
         self.auth = Auth(app_id=app_id, app_key=app_key, api_url=api_url, files_api_url=files_api_url)
         configure_logging()
         self.improve_mathpix = improve_mathpix
         self.request_options = request_options or {}
+        if encoding == 'msgpack':
+            require_msgpack()
+            if urlparse(self.auth.api_url).hostname in _JSON_ONLY_API_HOSTS:
+                logger.warning(f"{self.auth.api_url} does not accept msgpack request bodies, using json")
+                encoding = 'json'
+        self.encoding = encoding
+        # Built once since batch submission loops call these methods many times
+        self._image_endpoint = urljoin(self.auth.api_url, 'v3/text')
+        self._pdf_endpoint = urljoin(self.auth.api_url, 'v3/pdf')
+        self._batch_endpoint = urljoin(self.auth.api_url, 'v3/file-batches')
+        self._converter_endpoint = urljoin(self.auth.api_url, 'v3/converter')
         logger.debug(f"MathpixClient initialized with API URL: {self.auth.api_url}")
 
     def image_new(
@@ -271,12 +341,20 @@ class MathpixClient:
 
         Raises:
             ValueError: If exactly one of file_path and url are not provided.
+            ValidationError: If a confidence threshold is outside 0 to 1.
         """
         if (file_path is None and url is None) or (file_path is not None and url is not None):
             logger.error("Invalid parameters: Exactly one of file_path or url must be provided")
             raise ValidationError("Exactly one of file_path or url must be provided")
+        for name, value in (
+            ("confidence_threshold", confidence_threshold),
+            ("confidence_rate_threshold", confidence_rate_threshold),
+            ("auto_rotate_confidence_threshold", auto_rotate_confidence_threshold),
+        ):
+            if value is not None and not 0.0 <= value <= 1.0:
+                raise ValidationError(f"{name} must be between 0 and 1")
         _reject_reserved_extra_options(extra_options, _IMAGE_REQUEST_OPTION_KEYS)
-        endpoint = urljoin(self.auth.api_url, 'v3/text')
+        endpoint = self._image_endpoint
         image_options: Dict[str, Any] = {
             "metadata": {
                 "mpxpy": True,
@@ -358,19 +436,17 @@ class MathpixClient:
             image_options["metadata"]["improve_mathpix"] = False
         if extra_options:
             image_options.update(extra_options)
-        data = {
-            "options_json": json.dumps(image_options)
-        }
         if file_path:
-            path = Path(file_path)
-            if not path.is_file():
-                logger.error(f"File not found: {file_path}")
-                raise FileNotFoundError(f"File path not found: {file_path}")
-            with path.open("rb") as image_file:
-                files = {"file": image_file}
+            image_file = _open_upload(file_path)
+            # Only multipart uploads send the options as a serialized form field
+            data = {
+                "options_json": encode_json(image_options).decode()
+            }
+            with image_file:
                 result = None
                 try:
-                    response = post(endpoint, data=data, files=files, headers=self.auth.headers, **self.request_options)
+                    upload = multipart_kwargs(data, "file", image_file, self.auth.headers)
+                    response = post(endpoint, **upload, session=self.auth.session, **self.request_options)
                     response.raise_for_status()
                     result = response.json()
                     request_id = result['request_id']
@@ -385,7 +461,7 @@ class MathpixClient:
             image_options["src"] = url
             result = None
             try:
-                response = post(endpoint, json=image_options, headers=self.auth.headers, **self.request_options)
+                response = post(endpoint, json=image_options, headers=self.auth.headers, session=self.auth.session, **self.request_options)
                 response.raise_for_status()
                 result = response.json()
                 request_id = result['request_id']
@@ -499,6 +575,152 @@ class MathpixClient:
             MathpixClientError: If the API request fails.
             NotImplementedError: If the API URL is set to the production API and webhook or file_batch_id parameters are provided.
         """
+        options, pdf_kwargs = self._prepare_pdf_new(
+            file_path=file_path,
+            url=url,
+            metadata=metadata,
+            alphabets_allowed=alphabets_allowed,
+            rm_spaces=rm_spaces,
+            rm_fonts=rm_fonts,
+            idiomatic_eqn_arrays=idiomatic_eqn_arrays,
+            include_equation_tags=include_equation_tags,
+            include_smiles=include_smiles,
+            include_chemistry_as_image=include_chemistry_as_image,
+            include_diagram_text=include_diagram_text,
+            numbers_default_to_math=numbers_default_to_math,
+            math_inline_delimiters=math_inline_delimiters,
+            math_display_delimiters=math_display_delimiters,
+            page_ranges=page_ranges,
+            enable_spell_check=enable_spell_check,
+            auto_number_sections=auto_number_sections,
+            remove_section_numbering=remove_section_numbering,
+            preserve_section_numbering=preserve_section_numbering,
+            enable_tables_fallback=enable_tables_fallback,
+            fullwidth_punctuation=fullwidth_punctuation,
+            convert_to_docx=convert_to_docx,
+            convert_to_md=convert_to_md,
+            convert_to_mmd=convert_to_mmd,
+            convert_to_tex_zip=convert_to_tex_zip,
+            convert_to_html=convert_to_html,
+            convert_to_pdf=convert_to_pdf,
+            convert_to_md_zip=convert_to_md_zip,
+            convert_to_mmd_zip=convert_to_mmd_zip,
+            convert_to_pptx=convert_to_pptx,
+            convert_to_html_zip=convert_to_html_zip,
+            improve_mathpix=improve_mathpix,
+            file_batch_id=file_batch_id,
+            webhook_url=webhook_url,
+            mathpix_webhook_secret=mathpix_webhook_secret,
+            webhook_payload=webhook_payload,
+            webhook_enabled_events=webhook_enabled_events,
+            disable_itemize=disable_itemize,
+            disable_lstlisting=disable_lstlisting,
+            include_page_info=include_page_info,
+            include_page_breaks=include_page_breaks,
+            conversion_options=conversion_options,
+            extra_options=extra_options,
+        )
+        endpoint = self._pdf_endpoint
+        if file_path:
+            logger.debug("Creating new PDF: path=%s", file_path)
+            pdf_file = _open_upload(file_path, buffering=_PDF_UPLOAD_BUFFER_SIZE)
+            # Only multipart uploads send the options as a serialized form field
+            data = {
+                "options_json": encode_json(options).decode()
+            }
+            with pdf_file:
+                upload = multipart_kwargs(data, "file", pdf_file, self.auth.headers)
+                response_json = self._post_json(endpoint, "Mathpix PDF request failed", **upload, **self.request_options)
+        else:
+            logger.debug("Creating new PDF: url=%s", url)
+            response_json = self._post_json(endpoint, "Mathpix PDF request failed", json=options, headers=self.auth.headers, **self.request_options)
+        if 'pdf_id' not in response_json:
+            logger.error(f"PDF upload failed: {response_json}")
+            raise MathpixClientError(f"Mathpix PDF request failed: {response_json}")
+        pdf_id = response_json['pdf_id']
+        logger.debug("PDF processing started, PDF ID: %s", pdf_id)
+        return Pdf(auth=self.auth, pdf_id=pdf_id, **pdf_kwargs)
+
+    def _post_json(self, endpoint: str, error_message: str, **kwargs: Any) -> Dict[str, Any]:
+        """POST to the API over the pooled session and decode the response body.
+
+        Args:
+            endpoint: URL to post to
+            error_message: Prefix for the MathpixClientError raised on failure
+            **kwargs: Additional arguments to pass to post()
+
+        Returns:
+            dict: The decoded response body
+
+        Raises:
+            MathpixClientError: If the request fails, returns an error status, or the body can't be decoded.
+        """
+        try:
+            response = post(endpoint, session=self.auth.session, **kwargs)
+            response.raise_for_status()
+            # Servers that accept msgpack may still answer in JSON
+            if self.encoding == 'msgpack' and response.headers.get('Content-Type', '').startswith('application/msgpack'):
+                return response_msgpack(response)
+            return decode_response_json(response)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"{error_message}: {e}")
+            raise MathpixClientError(f"{error_message}: {e}") from e
+
+    def _prepare_pdf_new(
+            self,
+            *,
+            file_path: Optional[str],
+            url: Optional[str],
+            metadata: Optional[Dict[str, Any]],
+            alphabets_allowed: Optional[Dict[str, str]],
+            rm_spaces: Optional[bool],
+            rm_fonts: Optional[bool],
+            idiomatic_eqn_arrays: Optional[bool],
+            include_equation_tags: Optional[bool],
+            include_smiles: Optional[bool],
+            include_chemistry_as_image: Optional[bool],
+            include_diagram_text: Optional[bool],
+            numbers_default_to_math: Optional[bool],
+            math_inline_delimiters: Optional[Tuple[str, str]],
+            math_display_delimiters: Optional[Tuple[str, str]],
+            page_ranges: Optional[str],
+            enable_spell_check: Optional[bool],
+            auto_number_sections: Optional[bool],
+            remove_section_numbering: Optional[bool],
+            preserve_section_numbering: Optional[bool],
+            enable_tables_fallback: Optional[bool],
+            fullwidth_punctuation: Optional[bool],
+            convert_to_docx: Optional[bool],
+            convert_to_md: Optional[bool],
+            convert_to_mmd: Optional[bool],
+            convert_to_tex_zip: Optional[bool],
+            convert_to_html: Optional[bool],
+            convert_to_pdf: Optional[bool],
+            convert_to_md_zip: Optional[bool],
+            convert_to_mmd_zip: Optional[bool],
+            convert_to_pptx: Optional[bool],
+            convert_to_html_zip: Optional[bool],
+            improve_mathpix: Optional[bool],
+            file_batch_id: Optional[str],
+            webhook_url: Optional[str],
+            mathpix_webhook_secret: Optional[str],
+            webhook_payload: Optional[Dict[str, Any]],
+            webhook_enabled_events: Optional[List[str]],
+            disable_itemize: Optional[bool],
+            disable_lstlisting: Optional[bool],
+            include_page_info: Optional[bool],
+            include_page_breaks: Optional[bool],
+            conversion_options: Optional[Dict[str, Any]],
+            extra_options: Optional[Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Validate pdf_new arguments and build the v3/pdf request options.
+
+        Shared by MathpixClient.pdf_new and MathpixAsyncClient.pdf_new. Takes every
+        pdf_new argument by keyword; the defaults live only in pdf_new's signature.
+
+        Returns:
+            tuple: The request options, and the keyword arguments for the Pdf to return
+        """
         if self.auth.api_url == 'https://api.mathpix.com':
             if any([webhook_url, mathpix_webhook_secret, webhook_payload, webhook_enabled_events]):
                 logger.warning("Webhook features not available in production API")
@@ -522,10 +744,8 @@ class MathpixClient:
             improve_mathpix = False
         elif not improve_mathpix:
             improve_mathpix = False
-        endpoint = urljoin(self.auth.api_url, 'v3/pdf')
         options = {
-            "math_inline_delimiters": ["$", "$"],
-            "rm_spaces": True,
+            **_PDF_DEFAULT_OPTIONS,
             "conversion_formats": {},
             "metadata": {
                 "improve_mathpix": improve_mathpix,
@@ -611,86 +831,30 @@ class MathpixClient:
             options["conversion_formats"]['html.zip'] = True
         if extra_options:
             options.update(extra_options)
-        data = {
-            "options_json": json.dumps(options)
-        }
-        if file_path:
-            logger.debug(f"Creating new PDF: path={file_path}")
-            path = Path(file_path)
-            if not path.is_file():
-                logger.error(f"File not found: {file_path}")
-                raise FileNotFoundError(f"File path not found: {file_path}")
-            with path.open("rb") as pdf_file:
-                files = {"file": pdf_file}
-                response_json = None
-                try:
-                    response = post(endpoint, data=data, files=files, headers=self.auth.headers, **self.request_options)
-                    response.raise_for_status()
-                    response_json = response.json()
-                    pdf_id = response_json['pdf_id']
-                    logger.debug(f"PDF from local path processing started, PDF ID: {pdf_id}")
-                    return Pdf(
-                        auth=self.auth,
-                        pdf_id=pdf_id,
-                        file_path=file_path,
-                        convert_to_docx=convert_to_docx,
-                        convert_to_md=convert_to_md,
-                        convert_to_mmd=convert_to_mmd,
-                        convert_to_tex_zip=convert_to_tex_zip,
-                        convert_to_html=convert_to_html,
-                        convert_to_pdf=convert_to_pdf,
-                        convert_to_md_zip=convert_to_md_zip,
-                        convert_to_mmd_zip=convert_to_mmd_zip,
-                        convert_to_pptx=convert_to_pptx,
-                        convert_to_html_zip=convert_to_html_zip,
-                        improve_mathpix=improve_mathpix,
-                        file_batch_id=file_batch_id,
-                        webhook_url=webhook_url,
-                        mathpix_webhook_secret=mathpix_webhook_secret,
-                        webhook_payload=webhook_payload,
-                        webhook_enabled_events=webhook_enabled_events,
-                        request_options=self.request_options,
-                    )
-                except requests.exceptions.RequestException as e:
-                    if response_json:
-                        logger.error(f"PDF upload failed: {response_json}")
-                    raise MathpixClientError(f"Mathpix PDF request failed: {e}")
-        else:
-            logger.debug(f"Creating new PDF: url={url}")
+        if not file_path:
             options["url"] = url
-            response_json = None
-            try:
-                response = post(endpoint, json=options, headers=self.auth.headers, **self.request_options)
-                response.raise_for_status()
-                response_json = response.json()
-                pdf_id = response_json['pdf_id']
-                logger.debug(f"PDF from URL processing started, PDF ID: {pdf_id}")
-                return Pdf(
-                        auth=self.auth,
-                        pdf_id=pdf_id,
-                        url=url,
-                        convert_to_docx=convert_to_docx,
-                        convert_to_md=convert_to_md,
-                        convert_to_mmd=convert_to_mmd,
-                        convert_to_tex_zip=convert_to_tex_zip,
-                        convert_to_html=convert_to_html,
-                        convert_to_pdf=convert_to_pdf,
-                        convert_to_md_zip=convert_to_md_zip,
-                        convert_to_mmd_zip=convert_to_mmd_zip,
-                        convert_to_pptx=convert_to_pptx,
-                        convert_to_html_zip=convert_to_html_zip,
-                        improve_mathpix=improve_mathpix,
-                        file_batch_id=file_batch_id,
-                        webhook_url=webhook_url,
-                        mathpix_webhook_secret=mathpix_webhook_secret,
-                        webhook_payload=webhook_payload,
-                        webhook_enabled_events=webhook_enabled_events,
-                        request_options=self.request_options,
-                    )
-            except Exception as e:
-                if response_json:
-                    logger.error(f"PDF upload failed: {response_json}")
-                raise MathpixClientError(f"Mathpix PDF request failed: {e}")
+        pdf_kwargs: Dict[str, Any] = dict(
+            file_path=file_path,
+            url=url,
+            convert_to_docx=convert_to_docx,
+            convert_to_md=convert_to_md,
+            convert_to_mmd=convert_to_mmd,
+            convert_to_tex_zip=convert_to_tex_zip,
+            convert_to_html=convert_to_html,
+            convert_to_pdf=convert_to_pdf,
+            convert_to_md_zip=convert_to_md_zip,
+            convert_to_mmd_zip=convert_to_mmd_zip,
+            convert_to_pptx=convert_to_pptx,
+            convert_to_html_zip=convert_to_html_zip,
+            improve_mathpix=improve_mathpix,
+            file_batch_id=file_batch_id,
+            webhook_url=webhook_url,
+            mathpix_webhook_secret=mathpix_webhook_secret,
+            webhook_payload=webhook_payload,
+            webhook_enabled_events=webhook_enabled_events,
+            request_options=self.request_options,
+        )
+        return options, pdf_kwargs
 
     def pdf_delete(self, pdf_id: str):
         """Delete a PDF and all associated files from S3.
@@ -739,16 +903,13 @@ class MathpixClient:
         Raises:
             MathpixClientError: If the API request fails.
         """
-        endpoint = urljoin(self.auth.api_url, 'v3/file-batches')
-        try:
-            response = post(endpoint, headers=self.auth.headers, **self.request_options)
-            response.raise_for_status()
-            response_json = response.json()
-            file_batch_id = response_json['file_batch_id']
-            return FileBatch(auth=self.auth, file_batch_id=file_batch_id, request_options=self.request_options)
-        except requests.exceptions.RequestException as e:
-            logger.error(f"File batch creation failed: {e}")
-            raise MathpixClientError(f"Mathpix request failed: {e}")
+        endpoint = self._batch_endpoint
+        response_json = self._post_json(endpoint, "Mathpix request failed", headers=self.auth.headers, **self.request_options)
+        if 'file_batch_id' not in response_json:
+            logger.error(f"File batch creation failed: {response_json}")
+            raise MathpixClientError(f"Mathpix request failed: {response_json}")
+        file_batch_id = response_json['file_batch_id']
+        return FileBatch(auth=self.auth, file_batch_id=file_batch_id, request_options=self.request_options)
 
     def conversion_new(
             self,
@@ -790,8 +951,67 @@ class MathpixClient:
             MathpixClientError: If the API request fails.
         """
         logger.debug("Starting new MMD conversion")
+        options, conversion_kwargs = self._prepare_conversion_new(
+            mmd=mmd,
+            convert_to_docx=convert_to_docx,
+            convert_to_md=convert_to_md,
+            convert_to_tex_zip=convert_to_tex_zip,
+            convert_to_html=convert_to_html,
+            convert_to_pdf=convert_to_pdf,
+            convert_to_latex_pdf=convert_to_latex_pdf,
+            convert_to_md_zip=convert_to_md_zip,
+            convert_to_mmd_zip=convert_to_mmd_zip,
+            convert_to_pptx=convert_to_pptx,
+            convert_to_html_zip=convert_to_html_zip,
+            conversion_options=conversion_options,
+            extra_options=extra_options,
+        )
+        endpoint = self._converter_endpoint
+        body, headers = self._encode_conversion_body(options)
+        response_json = self._post_json(endpoint, "Mathpix conversion request failed", data=body, headers=headers)
+        if 'error' in response_json or 'conversion_id' not in response_json:
+            logger.error(f"Conversion failed: {response_json}")
+            raise MathpixClientError(f"Mathpix conversion request failed: {response_json}")
+        conversion_id = response_json['conversion_id']
+        logger.debug("Conversion created, ID: %s", conversion_id)
+        return Conversion(auth=self.auth, conversion_id=conversion_id, **conversion_kwargs)
+
+    def _encode_conversion_body(self, options: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+        """Serialize a v3/converter request body in the client's encoding.
+
+        mmd can be large, so the body is serialized up front rather than by requests.
+        """
+        if self.encoding == 'msgpack':
+            headers = {**self.auth.headers, 'Content-Type': 'application/msgpack', 'Accept': 'application/msgpack, application/json'}
+            return encode_msgpack(options), headers
+        return encode_json(options), {**self.auth.headers, 'Content-Type': 'application/json'}
+
+    def _prepare_conversion_new(
+            self,
+            *,
+            mmd: str,
+            convert_to_docx: Optional[bool],
+            convert_to_md: Optional[bool],
+            convert_to_tex_zip: Optional[bool],
+            convert_to_html: Optional[bool],
+            convert_to_pdf: Optional[bool],
+            convert_to_latex_pdf: Optional[bool],
+            convert_to_md_zip: Optional[bool],
+            convert_to_mmd_zip: Optional[bool],
+            convert_to_pptx: Optional[bool],
+            convert_to_html_zip: Optional[bool],
+            conversion_options: Optional[Dict[str, Any]],
+            extra_options: Optional[Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Validate conversion_new arguments and build the v3/converter request options.
+
+        Shared by MathpixClient.conversion_new and MathpixAsyncClient.conversion_new. Takes
+        every conversion_new argument by keyword; the defaults live only in conversion_new's signature.
+
+        Returns:
+            tuple: The request options, and the keyword arguments for the Conversion to return
+        """
         _reject_reserved_extra_options(extra_options, _CONVERSION_REQUEST_OPTION_KEYS)
-        endpoint = urljoin(self.auth.api_url, 'v3/converter')
         options = {
             "mmd": mmd,
             "formats": {}
@@ -822,35 +1042,20 @@ class MathpixClient:
             options.update(extra_options)
         if len(options['formats'].items()) == 0:
             raise ValidationError("At least one format is required.")
-        response_json = None
-        try:
-            response = post(endpoint, json=options, headers=self.auth.headers)
-            response.raise_for_status()
-            response_json = response.json()
-            if 'error' in response_json:
-                logger.error(f"Conversion failed: {response_json}")
-                raise MathpixClientError(f"Conversion failed: {response_json}")
-            conversion_id = response_json['conversion_id']
-            logger.debug(f"Conversion created, ID: {conversion_id}")
-            return Conversion(
-                auth=self.auth,
-                conversion_id=conversion_id,
-                convert_to_docx=convert_to_docx,
-                convert_to_md=convert_to_md,
-                convert_to_tex_zip=convert_to_tex_zip,
-                convert_to_html=convert_to_html,
-                convert_to_pdf=convert_to_pdf,
-                convert_to_latex_pdf=convert_to_latex_pdf,
-                convert_to_md_zip=convert_to_md_zip,
-                convert_to_mmd_zip=convert_to_mmd_zip,
-                convert_to_pptx=convert_to_pptx,
-                convert_to_html_zip=convert_to_html_zip,
-                request_options=self.request_options,
-            )
-        except Exception as e:
-            if response_json:
-                logger.error(f"Conversion failed: {response_json}")
-            raise MathpixClientError(f"Mathpix conversion request failed: {e}")
+        conversion_kwargs: Dict[str, Any] = dict(
+            convert_to_docx=convert_to_docx,
+            convert_to_md=convert_to_md,
+            convert_to_tex_zip=convert_to_tex_zip,
+            convert_to_html=convert_to_html,
+            convert_to_pdf=convert_to_pdf,
+            convert_to_latex_pdf=convert_to_latex_pdf,
+            convert_to_md_zip=convert_to_md_zip,
+            convert_to_mmd_zip=convert_to_mmd_zip,
+            convert_to_pptx=convert_to_pptx,
+            convert_to_html_zip=convert_to_html_zip,
+            request_options=self.request_options,
+        )
+        return options, conversion_kwargs
 
     def file_new(
             self,
@@ -1062,7 +1267,7 @@ class MathpixClient:
         if has_idempotency_key:
             headers['Idempotency-Key'] = idempotency_key
         try:
-            response: requests.Response = post(endpoint, json=options, headers=headers, **self.request_options)
+            response: requests.Response = post(endpoint, json=options, headers=headers, session=self.auth.session, **self.request_options)
             has_failed: bool = not response.ok
             if has_failed:
                 raise error_from_response(response)
@@ -1152,12 +1357,8 @@ class MathpixClient:
         if extra_options:
             options.update(extra_options)
         logger.debug("Creating new file via Files API multipart upload")
-        path: Path = Path(file_path)
-        is_existing_file: bool = path.is_file()
-        if not is_existing_file:
-            raise FileNotFoundError(f"File path not found: {file_path}")
         endpoint: str = urljoin(self.auth.files_api_url, '/files/v1')
-        data: Dict[str, str] = {"options_json": json.dumps(options)}
+        data: Dict[str, str] = {"options_json": encode_json(options).decode()}
         if filename:
             data["filename"] = filename
         if job_id:
@@ -1167,10 +1368,10 @@ class MathpixClient:
         headers: Dict[str, str] = dict(self.auth.headers)
         if idempotency_key is not None:
             headers['Idempotency-Key'] = idempotency_key
-        with path.open("rb") as f:
+        with _open_upload(file_path) as f:
             files: Dict[str, Any] = {"file": f}
             try:
-                response: requests.Response = post(endpoint, data=data, files=files, headers=headers, **self.request_options)
+                response: requests.Response = post(endpoint, data=data, files=files, headers=headers, session=self.auth.session, **self.request_options)
                 has_failed: bool = not response.ok
                 if has_failed:
                     raise error_from_response(response)
@@ -1336,7 +1537,7 @@ class MathpixClient:
         if has_idempotency_key:
             headers['Idempotency-Key'] = idempotency_key
         try:
-            response: requests.Response = post(endpoint, json=body, headers=headers, **self.request_options)
+            response: requests.Response = post(endpoint, json=body, headers=headers, session=self.auth.session, **self.request_options)
             has_failed: bool = not response.ok
             if has_failed:
                 raise error_from_response(response)
@@ -1387,7 +1588,7 @@ class MathpixClient:
         if paging_state:
             params["paging_state"] = paging_state
         try:
-            response: requests.Response = get(endpoint, headers=self.auth.headers, params=params, **self.request_options)
+            response: requests.Response = get(endpoint, headers=self.auth.headers, params=params, session=self.auth.session, **self.request_options)
             has_failed: bool = not response.ok
             if has_failed:
                 raise error_from_response(response)
@@ -1479,7 +1680,7 @@ class MathpixClient:
         logger.debug("Getting data source onboarding identities")
         endpoint: str = urljoin(self.auth.files_api_url, '/files/v1/onboarding/identities')
         try:
-            response: requests.Response = get(endpoint, headers=self.auth.headers, **self.request_options)
+            response: requests.Response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
             has_failed: bool = not response.ok
             if has_failed:
                 raise error_from_response(response)
@@ -1573,7 +1774,7 @@ class MathpixClient:
         if has_secret:
             body["secret"] = secret
         try:
-            response: requests.Response = post(endpoint, json=body, headers=self.auth.headers, **self.request_options)
+            response: requests.Response = post(endpoint, json=body, headers=self.auth.headers, session=self.auth.session, **self.request_options)
             has_failed: bool = not response.ok
             if has_failed:
                 raise error_from_response(response)
@@ -1600,7 +1801,7 @@ class MathpixClient:
         logger.debug("Listing data sources")
         endpoint: str = urljoin(self.auth.files_api_url, '/files/v1/data-sources')
         try:
-            response: requests.Response = get(endpoint, headers=self.auth.headers, **self.request_options)
+            response: requests.Response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
             has_failed: bool = not response.ok
             if has_failed:
                 raise error_from_response(response)
@@ -1799,7 +2000,7 @@ class MathpixClient:
         if paging_state:
             params["paging_state"] = paging_state
         try:
-            response = get(endpoint, headers=self.auth.headers, params=params, **self.request_options)
+            response = get(endpoint, headers=self.auth.headers, params=params, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -1839,7 +2040,7 @@ class MathpixClient:
         if paging_state:
             params["paging_state"] = paging_state
         try:
-            response: requests.Response = get(endpoint, headers=self.auth.headers, params=params, **self.request_options)
+            response: requests.Response = get(endpoint, headers=self.auth.headers, params=params, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -1864,7 +2065,7 @@ class MathpixClient:
         endpoint: str = urljoin(self.auth.files_api_url, '/files/v1/scs-jobs/status')
         params: Dict[str, str] = {'scs_job_id': scs_job_id}
         try:
-            response: requests.Response = get(endpoint, headers=self.auth.headers, params=params, **self.request_options)
+            response: requests.Response = get(endpoint, headers=self.auth.headers, params=params, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -1916,7 +2117,7 @@ class MathpixClient:
         if group_by:
             params['group_by'] = group_by
         try:
-            response = get(endpoint, headers=self.auth.headers, params=params, **self.request_options)
+            response = get(endpoint, headers=self.auth.headers, params=params, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -1996,7 +2197,7 @@ class MathpixClient:
         if contains_algorithm is not None:
             params['contains_algorithm'] = contains_algorithm
         try:
-            response = get(endpoint, headers=self.auth.headers, params=params, **self.request_options)
+            response = get(endpoint, headers=self.auth.headers, params=params, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -2036,7 +2237,7 @@ class MathpixClient:
         if pdf_id:
             params['pdf_id'] = pdf_id
         try:
-            response = get(endpoint, headers=self.auth.headers, params=params, **self.request_options)
+            response = get(endpoint, headers=self.auth.headers, params=params, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -2073,7 +2274,7 @@ class MathpixClient:
         if app_id:
             params['app_id'] = app_id
         try:
-            response = get(endpoint, headers=self.auth.headers, params=params, **self.request_options)
+            response = get(endpoint, headers=self.auth.headers, params=params, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -2110,7 +2311,7 @@ class MathpixClient:
         if strokes_session_id:
             body["strokes_session_id"] = strokes_session_id
         try:
-            response = post(endpoint, json=body, headers=self.auth.headers, **self.request_options)
+            response = post(endpoint, json=body, headers=self.auth.headers, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -2154,7 +2355,7 @@ class MathpixClient:
         if user_id is not None:
             body['user_id'] = user_id
         try:
-            response = post(endpoint, json=body, headers=self.auth.headers, **self.request_options)
+            response = post(endpoint, json=body, headers=self.auth.headers, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -2180,7 +2381,7 @@ class MathpixClient:
         logger.debug(f"Getting app token info: {app_token[:20]}...")
         endpoint = urljoin(self.auth.api_url, f'v3/app-tokens/{app_token}')
         try:
-            response = get(endpoint, headers=self.auth.headers, **self.request_options)
+            response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -2278,7 +2479,7 @@ class MathpixClient:
                 body["metadata"] = {}
             body["metadata"]["improve_mathpix"] = False
         try:
-            response = post(endpoint, json=body, headers=self.auth.headers, **self.request_options)
+            response = post(endpoint, json=body, headers=self.auth.headers, session=self.auth.session, **self.request_options)
             response.raise_for_status()
             result = response.json()
             batch_id = result.get('batch_id')
@@ -6,7 +6,7 @@ from urllib.parse import urljoin
 from mpxpy.auth import Auth
 from mpxpy.logger import logger
 from mpxpy.errors import ValidationError, ConversionIncompleteError, FilesystemError
-from mpxpy.request_handler import get
+from mpxpy.request_handler import get, write_response_to_file
 
 
 class Pdf:
@@ -191,7 +191,7 @@ class Pdf:
         """
         logger.debug(f"Getting status for PDF {self.pdf_id}")
         endpoint = urljoin(self.auth.api_url, f'v3/pdf/{self.pdf_id}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         return response.json()
 
     def pdf_conversion_status(self):
@@ -202,15 +202,19 @@ class Pdf:
         """
         logger.debug(f"Getting conversion status for PDF {self.pdf_id}")
         endpoint = urljoin(self.auth.api_url, f'v3/converter/{self.pdf_id}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         return response.json()
 
-    def save_file(self, path: str, conversion_format: str) -> str:
+    def save_file(self, path: str, conversion_format: str, direct_io: bool = False, preallocate: bool = False) -> str:
         """Helper function to save the processed PDF result to a local path.
 
         Args:
             path: The local file path where the output will be saved
             conversion_format: The format in which the output will be saved
+            direct_io: Optional boolean to write with O_DIRECT, bypassing the page cache.
+                Useful for very large outputs; ignored where O_DIRECT is unavailable.
+            preallocate: Optional boolean to reserve disk space for the whole file before writing.
+                Only worthwhile on local filesystems with native fallocate support; ignored elsewhere.
 
         Returns:
             output_path: The path of the saved Markdown file
@@ -223,17 +227,15 @@ class Pdf:
             path = os.path.join(path, filename)
         logger.debug(f"Downloading output for PDF {self.pdf_id} in format {conversion_format} to path {path}")
         endpoint = urljoin(self.auth.api_url, f'v3/pdf/{self.pdf_id}.{conversion_format}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, stream=True, **self.request_options)
         if response.status_code == 404:
+            response.close()
             raise ConversionIncompleteError("Conversion not complete")
         try:
             directory = os.path.dirname(path)
             if directory:
                 os.makedirs(directory, exist_ok=True)
-            with open(path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+            write_response_to_file(response, path, direct_io=direct_io, preallocate=preallocate)
         except Exception:
             raise FilesystemError('Failed to save file to system')
         logger.debug(f"File saved successfully to {path}")
@@ -253,7 +255,7 @@ class Pdf:
         """
         logger.debug(f"Downloading output for PDF {self.pdf_id} in format: {conversion_format}")
         endpoint = urljoin(self.auth.api_url, f'v3/pdf/{self.pdf_id}.{conversion_format}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         if response.status_code == 404:
             raise ConversionIncompleteError("Conversion not complete")
         return json.loads(response.text)
@@ -272,7 +274,7 @@ class Pdf:
         """
         logger.debug(f"Downloading output for PDF {self.pdf_id} in format: {conversion_format}")
         endpoint = urljoin(self.auth.api_url, f'v3/pdf/{self.pdf_id}.{conversion_format}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         if response.status_code == 404:
             raise ConversionIncompleteError("Conversion not complete")
         return response.text
@@ -291,7 +293,7 @@ class Pdf:
         """
         logger.debug(f"Downloading output for PDF {self.pdf_id} in format: {conversion_format}")
         endpoint = urljoin(self.auth.api_url, f'v3/pdf/{self.pdf_id}.{conversion_format}')
-        response = get(endpoint, headers=self.auth.headers, **self.request_options)
+        response = get(endpoint, headers=self.auth.headers, session=self.auth.session, **self.request_options)
         if response.status_code == 404:
             raise ConversionIncompleteError("Conversion not complete")
         return response.content
@@ -1,26 +1,70 @@
+import errno
+import json
+import mmap
+import os
+import shutil
 import requests
+from mpxpy import http_client
 from mpxpy.errors import MathpixClientError
 from mpxpy.logger import logger
-from typing import Any
+from typing import Any, BinaryIO, Dict, List, Optional
 
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # requests-toolbelt is optional, installed with mpxpy[streaming]
+    MultipartEncoder = None
 
-def make_request(method: str, url: str, **kwargs: Any):
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, installed with mpxpy[fast-json]
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional, installed with mpxpy[msgpack]
+    msgpack = None
+
+# Downloads are copied to disk in 1 MiB blocks, keeping the number of read and
+# write calls low for multi-megabyte outputs.
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+
+# O_DIRECT writes must start at, and be sized in multiples of, the block size.
+_DIRECT_IO_ALIGNMENT = 4096
+
+# Network chunks read with read1() are gathered and written with one writev()
+# call per DOWNLOAD_BUFFER_SIZE bytes, or per this many chunks (well under the
+# usual IOV_MAX of 1024) if the chunks are small.
+_READ_CHUNK_SIZE = 64 * 1024
+_WRITEV_MAX_BUFFERS = 256
+
+
+def make_request(method: str, url: str, session: Optional[requests.Session] = None, **kwargs: Any):
     """
     Make an HTTP request with standardized error handling.
 
     Args:
         method: HTTP method (GET, POST, etc.)
         url: The URL to request
+        session: Optional requests.Session to send the request through, reusing its
+            pooled connections. If None, a one-off connection is used.
         **kwargs: Additional arguments to pass to requests
 
+    With MPXPY_HTTPX=1, requests whose arguments httpx supports are sent through
+    the shared HTTP/2 client in mpxpy.http_client instead.
+
     Returns:
-        requests.Response object
+        requests.Response object, or a compatible http_client.HttpxResponse
 
     Raises:
         MathpixClientError: For any request-related failures
     """
     try:
-        response = requests.request(method, url, **kwargs)
+        if http_client.is_enabled() and http_client.supports(kwargs):
+            return http_client.request(method, url, **kwargs)
+        requester = session.request if session is not None else requests.request
+        response = requester(method, url, **kwargs)
         return response
     except requests.exceptions.ConnectionError as e:
         error_msg = f"Connection error: {str(e)}"
@@ -40,17 +84,245 @@ def make_request(method: str, url: str, **kwargs: Any):
         raise MathpixClientError(error_msg)
 
 
-def get(url: str, **kwargs: Any):
-    return make_request('GET', url, **kwargs)
+def get(url: str, session: Optional[requests.Session] = None, **kwargs: Any):
+    return make_request('GET', url, session=session, **kwargs)
+
 
+def post(url: str, session: Optional[requests.Session] = None, **kwargs: Any):
+    return make_request('POST', url, session=session, **kwargs)
 
-def post(url: str, **kwargs: Any):
-    return make_request('POST', url, **kwargs)
 
+def put(url: str, session: Optional[requests.Session] = None, **kwargs: Any):
+    return make_request('PUT', url, session=session, **kwargs)
 
-def put(url: str, **kwargs: Any):
-    return make_request('PUT', url, **kwargs)
 
+def delete(url: str, session: Optional[requests.Session] = None, **kwargs: Any):
+    return make_request('DELETE', url, session=session, **kwargs)
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode a response's JSON body, using orjson when it is installed.
+
+    Large payloads such as OCR line data parse several times faster with orjson
+    than with requests' stdlib-based Response.json().
+    """
+    return _json_loads(response.content)
+
+
+def encode_json(obj: Any) -> bytes:
+    """Serialize a request body to JSON bytes, using orjson when it is installed.
+
+    Request bodies carrying full MMD documents serialize several times faster
+    with orjson, which also produces bytes directly rather than a str that
+    requests has to encode again.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
 
-def delete(url: str, **kwargs: Any):
-    return make_request('DELETE', url, **kwargs)
+
+def require_msgpack() -> None:
+    """Raise a helpful error if the optional msgpack dependency is missing."""
+    if msgpack is None:
+        raise MathpixClientError('encoding="msgpack" requires msgpack. Install it with: pip install "mpxpy[msgpack]"')
+
+
+def encode_msgpack(obj: Any) -> bytes:
+    """Serialize a request body to MessagePack.
+
+    Strings are stored length-prefixed rather than escaped, so LaTeX-heavy MMD
+    encodes smaller than it does as JSON.
+    """
+    return msgpack.packb(obj, use_bin_type=True)
+
+
+def response_msgpack(response: requests.Response) -> Any:
+    """Decode a response's MessagePack body."""
+    return msgpack.unpackb(response.content, raw=False)
+
+
+def multipart_kwargs(data: Dict[str, str], file_field: str, file: BinaryIO, headers: Dict[str, str]) -> Dict[str, Any]:
+    """Build the request arguments for a multipart upload of form fields and one file.
+
+    With requests-toolbelt installed, the body is streamed from the file as it is
+    sent, so memory use doesn't grow with the file size. Otherwise requests builds
+    the whole body in memory before sending.
+
+    Args:
+        data: Form fields to send alongside the file
+        file_field: Name of the form field holding the file
+        file: The open file to upload
+        headers: Request headers
+
+    Returns:
+        dict: Keyword arguments (data, files, headers) to pass to post()
+    """
+    if MultipartEncoder is None:
+        return {'data': data, 'files': {file_field: file}, 'headers': headers}
+    filename = os.path.basename(getattr(file, 'name', file_field))
+    encoder = MultipartEncoder(fields={**data, file_field: (filename, file)})
+    return {'data': encoder, 'headers': {**headers, 'Content-Type': encoder.content_type}}
+
+
+def _preallocate(fd: int, response: requests.Response) -> None:
+    """Reserve disk space for the response body up front, where the OS supports it.
+
+    Allocating the whole file at once lets the filesystem lay it out contiguously
+    instead of extending it on every write, and fails early if the disk is full.
+    Opt-in: on filesystems without native fallocate support (e.g. NFS),
+    posix_fallocate is emulated by writing zeros to every block, doubling the
+    write I/O of the download. Only done when Content-Length is the size of the decoded body (no
+    Content-Encoding); the file is truncated to the bytes actually written afterwards,
+    including when the download fails part way.
+    """
+    if not hasattr(os, 'posix_fallocate'):
+        return
+    headers = getattr(response, 'headers', None) or {}
+    content_length = headers.get('Content-Length')
+    if not content_length or headers.get('Content-Encoding') or not content_length.isdigit():
+        return
+    try:
+        os.posix_fallocate(fd, 0, int(content_length))
+    except OSError as e:
+        logger.debug(f"Could not preallocate download file: {str(e)}")
+
+
+def _write_buffered(raw: Any, response: requests.Response, path: str, preallocate: bool) -> None:
+    if not hasattr(raw, 'read1'):
+        # urllib3 < 2 has no read1(); copy in whole blocks instead
+        with open(path, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+            if preallocate:
+                _preallocate(f.fileno(), response)
+            try:
+                shutil.copyfileobj(raw, f, DOWNLOAD_BUFFER_SIZE)
+            finally:
+                f.truncate()
+        return
+    with open(path, 'wb', buffering=0) as f:
+        if preallocate:
+            _preallocate(f.fileno(), response)
+        try:
+            _copy_gathered(raw, f)
+        finally:
+            f.truncate()
+
+
+def _copy_gathered(raw: Any, f: BinaryIO) -> None:
+    """Copy raw to f, gathering the chunks read1() returns into large writes.
+
+    read1() hands over whatever the socket has ready without waiting to fill a
+    block, and the gathered chunks go to disk with a single writev() scatter write
+    where the platform has one (POSIX), or joined into one write() elsewhere.
+    """
+    pending: List[bytes] = []
+    size = 0
+    while True:
+        chunk = raw.read1(_READ_CHUNK_SIZE)
+        if chunk:
+            pending.append(chunk)
+            size += len(chunk)
+        is_flush_due = size >= DOWNLOAD_BUFFER_SIZE or len(pending) >= _WRITEV_MAX_BUFFERS
+        if pending and (not chunk or is_flush_due):
+            _write_chunks(f, pending, size)
+            pending.clear()
+            size = 0
+        if not chunk:
+            break
+
+
+def _write_chunks(f: BinaryIO, chunks: List[bytes], size: int) -> None:
+    fd = f.fileno()
+    written = os.writev(fd, chunks) if hasattr(os, 'writev') else 0
+    if written < size:
+        remaining = memoryview(b''.join(chunks))[written:]
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+
+
+def _write_direct(raw: Any, response: requests.Response, path: str, preallocate: bool) -> bool:
+    """Write the body with O_DIRECT, bypassing the page cache.
+
+    Data is staged in a page-aligned buffer and written in whole blocks; the last
+    block is zero-padded and the file truncated to the real size afterwards.
+
+    Returns:
+        bool: False if O_DIRECT is not available for this platform or filesystem,
+            in which case nothing has been read from the response.
+    """
+    if not hasattr(os, 'O_DIRECT'):
+        return False
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+    except OSError as e:
+        if e.errno != errno.EINVAL:
+            raise
+        logger.debug(f"O_DIRECT not supported for {path}, using buffered writes")
+        return False
+    buffer = mmap.mmap(-1, DOWNLOAD_BUFFER_SIZE)
+    view = memoryview(buffer)
+    written = 0
+    try:
+        if preallocate:
+            _preallocate(fd, response)
+        filled = 0
+        while True:
+            count = raw.readinto(view[filled:])
+            if not count:
+                break
+            filled += count
+            if filled == len(view):
+                _write_all(fd, view)
+                written += filled
+                filled = 0
+        if filled:
+            padded = -(-filled // _DIRECT_IO_ALIGNMENT) * _DIRECT_IO_ALIGNMENT
+            view[filled:padded] = bytes(padded - filled)
+            _write_all(fd, view[:padded])
+            written += filled
+    finally:
+        try:
+            os.ftruncate(fd, written)
+        finally:
+            os.close(fd)
+            view.release()
+            buffer.close()
+    return True
+
+
+def _write_all(fd: int, data: memoryview) -> None:
+    if os.write(fd, data) != len(data):
+        raise OSError(errno.EIO, "Short write to download file")
+
+
+def write_response_to_file(response: requests.Response, path: str, direct_io: bool = False, preallocate: bool = False) -> None:
+    """Stream a response body to a local file and close the response.
+
+    The body is copied straight from the raw socket stream in large blocks, so the
+    request should be made with stream=True. Responses without a raw stream (such
+    as those from the optional httpx transport) are iterated in blocks of the same size.
+
+    Args:
+        response: The response whose body should be saved
+        path: The local file path to write to
+        direct_io: Write with O_DIRECT, bypassing the page cache. Intended for very
+            large outputs; falls back to buffered writes where O_DIRECT is unavailable.
+        preallocate: Reserve disk space for the whole file from Content-Length before
+            writing. Only worthwhile on filesystems with native fallocate support.
+    """
+    raw = getattr(response, 'raw', None)
+    try:
+        if raw is None:
+            with open(path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE):
+                    if chunk:
+                        f.write(chunk)
+            return
+        # Let urllib3 undo any gzip/deflate transfer encoding, as iter_content would
+        raw.decode_content = True
+        if direct_io and _write_direct(raw, response, path, preallocate):
+            return
+        _write_buffered(raw, response, path, preallocate)
+    finally:
+        close = getattr(response, 'close', None)
+        if close is not None:
+            close()
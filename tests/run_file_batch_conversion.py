@@ -1,5 +1,9 @@
+import asyncio
 import glob
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import pytest
+from mpxpy.async_client import MathpixAsyncClient
 from mpxpy.mathpix_client import MathpixClient
 
 @pytest.fixture
@@ -14,9 +18,10 @@ def process_pdf_folder(client):
     pdf_file_list = glob.glob(pdf_folder_path + "*.*")
     pdf_file_list = pdf_file_list[:2]
     print(pdf_file_list)
-    for pdf_file_path in pdf_file_list:
+
+    def send_pdf(pdf_file_path):
         print("Sending file: {}".format(pdf_file_path))
-        client.pdf_new(
+        return client.pdf_new(
             file_path=pdf_file_path,
             file_batch_id=file_batch.file_batch_id,
             webhook_url="http://gateway:8080/webhook/convert-api",
@@ -25,24 +30,23 @@ def process_pdf_folder(client):
                 "data": "test data"
             },
             webhook_enabled_events=["pdf_processing_complete"],
-            conversion_formats={
-                "docx": True
-            }
+            convert_to_docx=True,
         )
+
+    # Uploads are I/O bound, so a thread pool sharing the client's pooled session
+    # sends them concurrently
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(send_pdf, pdf_file_list))
     print(file_batch.file_batch_status())
     file_batch.wait_until_complete(timeout=60)
     print(file_batch.file_batch_status())
-    cursor=None
-    while True:
-        print("Fetching page of pdf IDs...")
-        files_list = file_batch.files(cursor=cursor)
-        for file in files_list["files"]:
+    # files_iter requests the next page while this one is being processed
+    for files_list in file_batch.files_iter():
+        print("Fetched page of pdf IDs...")
+        for file in files_list.files:
             print(file.pdf_id)
             # file.download_output_to_local_path('docx', 'outputs')
-        if not files_list["has_more"]:
-            break
-        else:
-            cursor = files_list["cursor"]
+
 
 """
     for pdf_id in completed_pdfs:
@@ -51,5 +55,30 @@ def process_pdf_folder(client):
         writeToBucket(path_to_file/pdf_id.
 """
 
+
+async def process_pdf_folder_async(client):
+    """Upload the folder's PDFs concurrently on one event loop."""
+    file_batch = client.file_batch_new()
+    pdf_folder_path = "./files/pdfs/"
+    pdf_file_list = glob.glob(pdf_folder_path + "*.*")
+    print(pdf_file_list)
+    async with MathpixAsyncClient(api_url=client.auth.api_url) as async_client:
+        pdfs = await asyncio.gather(*[
+            async_client.pdf_new(
+                file_path=pdf_file_path,
+                file_batch_id=file_batch.file_batch_id,
+                convert_to_docx=True,
+            )
+            for pdf_file_path in pdf_file_list
+        ])
+    print([pdf.pdf_id for pdf in pdfs])
+    file_batch.wait_until_complete(timeout=60)
+    print(file_batch.file_batch_status())
+
+
 if __name__ == '__main__':
-    process_pdf_folder(client())
\ No newline at end of file
+    # Pass --async to upload with MathpixAsyncClient instead of the thread pool
+    if '--async' in sys.argv:
+        asyncio.run(process_pdf_folder_async(client()))
+    else:
+        process_pdf_folder(client())
\ No newline at end of file
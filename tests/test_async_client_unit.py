@@ -0,0 +1,116 @@
+"""Unit tests for MathpixAsyncClient.
+
+These tests mock the request layer; no network access is required.
+"""
+import asyncio
+import inspect
+import json
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+import pytest
+from mpxpy.errors import MathpixClientError, ValidationError
+from mpxpy.mathpix_client import MathpixClient
+
+pytest.importorskip('aiohttp')
+
+from mpxpy.async_client import MathpixAsyncClient
+
+
+@pytest.fixture
+def client() -> MathpixAsyncClient:
+    return MathpixAsyncClient(app_id='test-app', app_key='test-key')
+
+
+def test_pdf_new_uploads_files_concurrently(client: MathpixAsyncClient, tmp_path) -> None:
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'document-{i}.pdf'
+        path.write_bytes(b'%PDF-1.4')
+        paths.append(str(path))
+    in_flight: List[int] = [0, 0]
+
+    async def fake_post_json(session: Any, url: str, **kwargs: Any) -> Dict[str, Any]:
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        # Hold each upload open until all of them have started, or give up after a second
+        for _ in range(100):
+            if in_flight[1] == len(paths):
+                break
+            await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        return {'pdf_id': f'pdf-{len(kwargs["data"]._fields)}'}
+
+    async def upload_all() -> List[Any]:
+        async with client:
+            return await asyncio.gather(*(client.pdf_new(file_path=path, convert_to_docx=True) for path in paths))
+
+    with patch('mpxpy.async_client.post_json', side_effect=fake_post_json) as mock_post_json:
+        pdfs = asyncio.run(upload_all())
+    assert [pdf.file_path for pdf in pdfs] == paths
+    assert all(pdf.convert_to_docx for pdf in pdfs)
+    assert in_flight[1] == 3
+    form = mock_post_json.call_args.kwargs['data']
+    options = json.loads(form._fields[0][2])
+    assert options['conversion_formats'] == {'docx': True}
+
+
+def test_pdf_new_sends_url_requests_as_json(client: MathpixAsyncClient) -> None:
+    async def create() -> Any:
+        async with client:
+            return await client.pdf_new(url='https://example.com/document.pdf', page_ranges='1-2')
+
+    with patch('mpxpy.async_client.post_json', new=AsyncMock(return_value={'pdf_id': 'pdf-1'})) as mock_post_json:
+        pdf = asyncio.run(create())
+    assert pdf.pdf_id == 'pdf-1'
+    sent = mock_post_json.await_args.kwargs['json']
+    assert sent['url'] == 'https://example.com/document.pdf'
+    assert sent['page_ranges'] == '1-2'
+
+
+def test_pdf_new_validates_like_the_sync_client(client: MathpixAsyncClient) -> None:
+    async def create(**kwargs: Any) -> Any:
+        async with client:
+            return await client.pdf_new(**kwargs)
+
+    with pytest.raises(ValidationError):
+        asyncio.run(create())
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(create(file_path='missing.pdf'))
+    with pytest.raises(TypeError):
+        asyncio.run(create(url='https://example.com/document.pdf', not_a_pdf_option=True))
+
+
+def test_methods_share_the_sync_client_signatures() -> None:
+    for async_method, method in ((MathpixAsyncClient.pdf_new, MathpixClient.pdf_new),
+                                 (MathpixAsyncClient.conversion_new, MathpixClient.conversion_new)):
+        async_parameters = inspect.signature(async_method).parameters
+        parameters = inspect.signature(method).parameters
+        assert list(async_parameters) == list(parameters)
+        assert [p.default for p in async_parameters.values()] == [p.default for p in parameters.values()]
+    # Arguments the coroutine only takes through **kwargs can't be passed positionally
+    pdf_new_parameters = inspect.signature(MathpixAsyncClient.pdf_new).parameters
+    assert pdf_new_parameters['url'].kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+    assert pdf_new_parameters['convert_to_docx'].kind is inspect.Parameter.KEYWORD_ONLY
+
+
+def test_conversion_new_returns_conversion(client: MathpixAsyncClient) -> None:
+    async def create() -> Any:
+        async with client:
+            return await client.conversion_new(mmd='# Document', convert_to_docx=True)
+
+    with patch('mpxpy.async_client.post_json', new=AsyncMock(return_value={'conversion_id': 'conversion-1'})) as mock_post_json:
+        conversion = asyncio.run(create())
+    assert conversion.conversion_id == 'conversion-1'
+    sent = mock_post_json.await_args.kwargs
+    assert json.loads(sent['data']) == {'mmd': '# Document', 'formats': {'docx': True}}
+    assert sent['headers']['Content-Type'] == 'application/json'
+
+
+def test_conversion_new_raises_on_api_error(client: MathpixAsyncClient) -> None:
+    async def create() -> Any:
+        async with client:
+            return await client.conversion_new(mmd='# Document', convert_to_docx=True)
+
+    with patch('mpxpy.async_client.post_json', new=AsyncMock(return_value={'error': 'Invalid MMD'})):
+        with pytest.raises(MathpixClientError):
+            asyncio.run(create())
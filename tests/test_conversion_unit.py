@@ -0,0 +1,329 @@
+"""Unit tests for Conversion polling and downloads.
+
+These tests mock the request layer; no network access is required.
+"""
+import asyncio
+import gzip
+import io
+import json
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+import pytest
+import requests
+import urllib3
+from mpxpy import conversion as conversion_module
+from mpxpy import request_handler
+from mpxpy.auth import Auth
+from mpxpy.conversion import Conversion
+from mpxpy.errors import FilesystemError
+
+
+class FakeResponse:
+    def __init__(
+            self,
+            status_code: int = 200,
+            json_body: Optional[Dict[str, Any]] = None,
+            content: bytes = b'',
+            headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.status_code: int = status_code
+        self._json_body: Optional[Dict[str, Any]] = json_body
+        self.content: bytes = content or json.dumps(json_body or {}).encode()
+        self.headers: Dict[str, str] = headers or {}
+
+    def json(self) -> Dict[str, Any]:
+        return self._json_body or {}
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so polling runs instantly."""
+    def __init__(self) -> None:
+        self.now: float = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def pending_status() -> Dict[str, Any]:
+    return {'status': 'processing', 'conversion_status': {'docx': {'status': 'processing'}}}
+
+
+def completed_status() -> Dict[str, Any]:
+    return {'status': 'completed', 'conversion_status': {'docx': {'status': 'completed'}}}
+
+
+@pytest.fixture
+def conversion() -> Conversion:
+    auth = Auth(app_id='test-app', app_key='test-key')
+    return Conversion(auth=auth, conversion_id='conversion-1', convert_to_docx=True)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake_clock = FakeClock()
+    monkeypatch.setattr(conversion_module.time, 'monotonic', fake_clock.monotonic)
+    monkeypatch.setattr(conversion_module.time, 'sleep', fake_clock.sleep)
+    return fake_clock
+
+
+def test_poll_delay_phases() -> None:
+    fast = conversion_module._poll_delay(attempts=1, elapsed=0.1)
+    assert 0.085 <= fast <= 0.115
+    ramp = conversion_module._poll_delay(attempts=20, elapsed=10.0)
+    assert 0.1 < ramp < 5.0
+    plateau = conversion_module._poll_delay(attempts=50, elapsed=60.0)
+    assert 4.25 <= plateau <= 5.75
+
+
+def test_wait_until_complete_polls_fast_for_short_conversions(conversion: Conversion, clock: FakeClock) -> None:
+    responses = [FakeResponse(json_body=pending_status()), FakeResponse(json_body=pending_status()),
+                 FakeResponse(json_body=completed_status())]
+    with patch('mpxpy.conversion.get', side_effect=responses) as mock_get:
+        assert conversion.wait_until_complete(timeout=10) is True
+    assert mock_get.call_count == 3
+    assert len(clock.sleeps) == 2
+    assert all(delay < 0.2 for delay in clock.sleeps)
+
+
+def test_wait_until_complete_timeout_is_in_seconds(conversion: Conversion, clock: FakeClock) -> None:
+    start = clock.now
+    with patch('mpxpy.conversion.get', return_value=FakeResponse(json_body=pending_status())) as mock_get:
+        assert conversion.wait_until_complete(timeout=60) is False
+    assert clock.now - start == pytest.approx(60.0)
+    # Backoff keeps the poll rate below the old fixed one poll per second
+    assert mock_get.call_count < 60
+
+
+def test_wait_until_complete_stops_on_error(conversion: Conversion, clock: FakeClock) -> None:
+    error_status = {'status': 'error', 'conversion_status': {}}
+    with patch('mpxpy.conversion.get', return_value=FakeResponse(json_body=error_status)) as mock_get:
+        assert conversion.wait_until_complete(timeout=10) is False
+    assert mock_get.call_count == 1
+
+
+def test_wait_until_complete_finishes_when_requested_formats_are_done(conversion: Conversion, clock: FakeClock) -> None:
+    # The top-level status still lags behind the finished docx output
+    lagging_status = {'status': 'processing', 'conversion_status': {'docx': {'status': 'completed'}}}
+    with patch('mpxpy.conversion.get', return_value=FakeResponse(json_body=lagging_status)) as mock_get:
+        assert conversion.wait_until_complete(timeout=10) is True
+    assert mock_get.call_count == 1
+
+
+def test_wait_until_complete_does_not_finish_when_requested_formats_failed(conversion: Conversion, clock: FakeClock) -> None:
+    failed_status = {'status': 'error', 'conversion_status': {'docx': {'status': 'error'}}}
+    with patch('mpxpy.conversion.get', return_value=FakeResponse(json_body=failed_status)) as mock_get:
+        assert conversion.wait_until_complete(timeout=10) is False
+    assert mock_get.call_count == 1
+    # A failed format doesn't end the wait early while the conversion is still running
+    failed_format_status = {'status': 'processing', 'conversion_status': {'docx': {'status': 'error'}}}
+    assert not conversion_module._is_completed(failed_format_status, ['docx'])
+
+
+def test_wait_until_complete_reports_each_format_as_it_completes(clock: FakeClock) -> None:
+    auth = Auth(app_id='test-app', app_key='test-key')
+    conversion = Conversion(auth=auth, conversion_id='conversion-1', convert_to_docx=True, convert_to_pdf=True)
+    statuses = [
+        {'status': 'processing', 'conversion_status': {'docx': {'status': 'processing'}, 'pdf': {'status': 'processing'}}},
+        {'status': 'processing', 'conversion_status': {'docx': {'status': 'completed'}, 'pdf': {'status': 'processing'}}},
+        {'status': 'processing', 'conversion_status': {'docx': {'status': 'completed'}, 'pdf': {'status': 'processing'}}},
+        {'status': 'completed', 'conversion_status': {'docx': {'status': 'completed'}, 'pdf': {'status': 'completed'}}},
+    ]
+    ready: List[str] = []
+    with patch('mpxpy.conversion.get', side_effect=[FakeResponse(json_body=status) for status in statuses]):
+        assert conversion.wait_until_complete(timeout=10, on_format_ready=ready.append) is True
+    assert ready == ['docx', 'pdf']
+
+
+def test_wait_until_complete_reuses_unchanged_status_on_304(conversion: Conversion, clock: FakeClock) -> None:
+    responses = [
+        FakeResponse(json_body=pending_status(), headers={'ETag': '"v1"'}),
+        FakeResponse(status_code=304, content=b' '),
+        FakeResponse(json_body=completed_status(), headers={'ETag': '"v2"'}),
+    ]
+    with patch('mpxpy.conversion.get', side_effect=responses) as mock_get:
+        assert conversion.wait_until_complete(timeout=10) is True
+    sent_headers = [call.kwargs['headers'] for call in mock_get.call_args_list]
+    assert 'If-None-Match' not in sent_headers[0]
+    assert sent_headers[1]['If-None-Match'] == '"v1"'
+    assert sent_headers[2]['If-None-Match'] == '"v1"'
+    assert 'If-None-Match' not in conversion.auth.headers
+
+
+def test_status_without_etag_is_not_conditional(conversion: Conversion, clock: FakeClock) -> None:
+    with patch('mpxpy.conversion.get', return_value=FakeResponse(json_body=pending_status())) as mock_get:
+        conversion.wait_until_complete(timeout=1)
+    assert all('If-None-Match' not in call.kwargs['headers'] for call in mock_get.call_args_list)
+
+
+def test_status_and_downloads_reuse_auth_session(conversion: Conversion) -> None:
+    with patch('mpxpy.conversion.get', return_value=FakeResponse(json_body=completed_status())) as mock_get:
+        conversion.conversion_status()
+        conversion.bytes_result('docx')
+    sessions = [call.kwargs['session'] for call in mock_get.call_args_list]
+    assert sessions == [conversion.auth.session, conversion.auth.session]
+    assert conversion.auth.session is conversion.auth.session
+
+
+def test_conversion_status_reuses_status_from_wait_until_complete(conversion: Conversion, clock: FakeClock) -> None:
+    with patch('mpxpy.conversion.get', return_value=FakeResponse(json_body=completed_status())) as mock_get:
+        assert conversion.wait_until_complete(timeout=10) is True
+        assert conversion.conversion_status()['status'] == 'completed'
+        assert mock_get.call_count == 1
+        clock.now += 1.0
+        conversion.conversion_status()
+        assert mock_get.call_count == 2
+
+
+def streamed_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = urllib3.HTTPResponse(body=io.BytesIO(body), headers=headers or {}, preload_content=False)
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    return response
+
+
+def test_save_file_streams_raw_body_to_disk(conversion: Conversion, tmp_path) -> None:
+    docx = b'PK' + bytes(range(256)) * 8192
+    response = streamed_response(gzip.compress(docx), headers={'Content-Encoding': 'gzip'})
+    with patch('mpxpy.conversion.get', return_value=response) as mock_get:
+        path = conversion.to_docx_file(path=str(tmp_path / 'out') + '/')
+    assert mock_get.call_args.kwargs['stream'] is True
+    with open(path, 'rb') as f:
+        assert f.read() == docx
+    assert response.raw.closed
+
+
+def test_save_file_preallocates_from_content_length_when_requested(conversion: Conversion, tmp_path, monkeypatch) -> None:
+    if not hasattr(request_handler.os, 'posix_fallocate'):
+        pytest.skip('os.posix_fallocate is not available')
+    fallocate_calls: List[int] = []
+    posix_fallocate = request_handler.os.posix_fallocate
+
+    def recording_fallocate(fd: int, offset: int, length: int) -> None:
+        fallocate_calls.append(length)
+        posix_fallocate(fd, offset, length)
+
+    monkeypatch.setattr(request_handler.os, 'posix_fallocate', recording_fallocate)
+    body = b'x' * 5000
+    response = streamed_response(body, headers={'Content-Length': str(len(body))})
+    with patch('mpxpy.conversion.get', return_value=response):
+        path = conversion.save_file(path=str(tmp_path / 'result.md'), conversion_format='md', preallocate=True)
+    assert fallocate_calls == [len(body)]
+    with open(path, 'rb') as f:
+        assert f.read() == body
+
+
+def test_save_file_does_not_preallocate_by_default(conversion: Conversion, tmp_path, monkeypatch) -> None:
+    fallocate_calls: List[int] = []
+    monkeypatch.setattr(request_handler.os, 'posix_fallocate', lambda fd, offset, length: fallocate_calls.append(length), raising=False)
+    body = b'x' * 5000
+    response = streamed_response(body, headers={'Content-Length': str(len(body))})
+    with patch('mpxpy.conversion.get', return_value=response):
+        conversion.to_md_file(path=str(tmp_path / 'result.md'))
+    assert fallocate_calls == []
+
+
+def test_save_file_truncates_preallocated_file_on_broken_download(conversion: Conversion, tmp_path) -> None:
+    # The connection drops after 1000 of the 4096 announced bytes
+    response = streamed_response(b'x' * 1000, headers={'Content-Length': '4096'})
+    path = tmp_path / 'result.md'
+    with patch('mpxpy.conversion.get', return_value=response):
+        with pytest.raises(FilesystemError):
+            conversion.save_file(path=str(path), conversion_format='md', preallocate=True)
+    # No zero-filled preallocated space is left behind
+    assert path.stat().st_size <= 1000
+
+
+def test_save_file_gathers_network_chunks_into_large_writes(conversion: Conversion, tmp_path, monkeypatch) -> None:
+    if not hasattr(request_handler.os, 'writev'):
+        pytest.skip('os.writev is POSIX only')
+    body = bytes(range(256)) * 12289
+    writev_calls: List[int] = []
+    writev = request_handler.os.writev
+
+    def counting_writev(fd: int, buffers: List[bytes]) -> int:
+        writev_calls.append(len(buffers))
+        return writev(fd, buffers)
+
+    monkeypatch.setattr(request_handler.os, 'writev', counting_writev)
+    with patch('mpxpy.conversion.get', return_value=streamed_response(body)):
+        path = conversion.to_md_file(path=str(tmp_path / 'result.md'))
+    with open(path, 'rb') as f:
+        assert f.read() == body
+    # 3 MiB of 64 KiB network chunks goes to disk in a handful of scatter writes
+    assert len(writev_calls) <= 4
+    assert max(writev_calls) > 1
+
+
+def test_save_file_without_writev_writes_exact_body(conversion: Conversion, tmp_path, monkeypatch) -> None:
+    monkeypatch.delattr(request_handler.os, 'writev', raising=False)
+    body = bytes(range(256)) * 12289
+    with patch('mpxpy.conversion.get', return_value=streamed_response(body)):
+        path = conversion.to_md_file(path=str(tmp_path / 'result.md'))
+    with open(path, 'rb') as f:
+        assert f.read() == body
+
+
+def test_save_file_direct_io_writes_exact_body(conversion: Conversion, tmp_path) -> None:
+    # Spans several staging buffers and ends on a partial block
+    body = bytes(range(256)) * 10001
+    response = streamed_response(body, headers={'Content-Length': str(len(body))})
+    with patch('mpxpy.conversion.get', return_value=response):
+        path = conversion.save_file(path=str(tmp_path / 'result.pdf'), conversion_format='pdf', direct_io=True)
+    with open(path, 'rb') as f:
+        assert f.read() == body
+
+
+def test_wait_until_complete_async_awaits_many_conversions_concurrently() -> None:
+    auth = Auth(app_id='test-app', app_key='test-key')
+    conversions = [Conversion(auth=auth, conversion_id=f'conversion-{i}', convert_to_docx=True) for i in range(3)]
+    statuses = [pending_status(), completed_status()] * len(conversions)
+
+    async def wait_all() -> List[bool]:
+        return await asyncio.gather(*(c.wait_until_complete_async(timeout=5, session=object()) for c in conversions))
+
+    with patch('mpxpy.conversion.async_get_json', new=AsyncMock(side_effect=statuses)) as mock_get_json:
+        assert asyncio.run(wait_all()) == [True, True, True]
+    assert mock_get_json.await_count == 6
+    urls = {call.args[1] for call in mock_get_json.await_args_list}
+    assert urls == {f'https://api.mathpix.com/v3/converter/conversion-{i}' for i in range(3)}
+
+
+def test_wait_until_complete_async_closes_its_default_session(conversion: Conversion) -> None:
+    sessions: List[MagicMock] = []
+
+    def fake_create_session() -> MagicMock:
+        session = MagicMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        sessions.append(session)
+        return session
+
+    with patch('mpxpy.conversion.create_session', side_effect=fake_create_session), \
+            patch('mpxpy.conversion.async_get_json', new=AsyncMock(return_value=completed_status())):
+        # Each asyncio.run gets its own loop, and so its own session
+        assert asyncio.run(conversion.wait_until_complete_async(timeout=5)) is True
+        assert asyncio.run(conversion.wait_until_complete_async(timeout=5)) is True
+    assert len(sessions) == 2
+    assert all(session.__aexit__.await_count == 1 for session in sessions)
+
+
+def test_download_outputs_returns_each_format(conversion: Conversion, tmp_path) -> None:
+    def fake_get(url: str, **kwargs: Any):
+        conversion_format = url.rsplit('conversion-1.', 1)[1]
+        if kwargs.get('stream'):
+            return streamed_response(conversion_format.encode())
+        return FakeResponse(content=conversion_format.encode())
+
+    with patch('mpxpy.conversion.get', side_effect=fake_get) as mock_get:
+        results = conversion.download_outputs(['docx', 'tex.zip', 'pdf'])
+        paths = conversion.download_outputs(['docx', 'pdf'], path=str(tmp_path))
+    assert results == {'docx': b'docx', 'tex.zip': b'tex.zip', 'pdf': b'pdf'}
+    assert paths == {'docx': str(tmp_path / 'conversion-1.docx'), 'pdf': str(tmp_path / 'conversion-1.pdf')}
+    assert (tmp_path / 'conversion-1.pdf').read_bytes() == b'pdf'
+    assert {call.kwargs['session'] for call in mock_get.call_args_list} == {conversion.auth.session}
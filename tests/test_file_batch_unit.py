@@ -0,0 +1,62 @@
+"""Unit tests for FileBatch status polling and file pagination.
+
+These tests mock the request layer; no network access is required.
+"""
+from typing import Any, Dict, List, Optional
+from unittest.mock import patch
+import pytest
+from mpxpy.auth import Auth
+from mpxpy.file_batch import FileBatch
+
+
+class FakeResponse:
+    def __init__(self, json_body: Optional[Dict[str, Any]] = None) -> None:
+        self.status_code: int = 200
+        self._json_body: Optional[Dict[str, Any]] = json_body
+
+    def json(self) -> Dict[str, Any]:
+        return self._json_body or {}
+
+
+@pytest.fixture
+def file_batch() -> FileBatch:
+    return FileBatch(auth=Auth(app_id='test-app', app_key='test-key'), file_batch_id='batch-1')
+
+
+def batch_status(completed_files: int) -> Dict[str, Any]:
+    return {'total_files': 2, 'completed_files': completed_files, 'error_files': 0}
+
+
+def test_file_batch_status_reuses_recent_status(file_batch: FileBatch) -> None:
+    with patch('mpxpy.file_batch.get', return_value=FakeResponse(batch_status(2))) as mock_get:
+        assert file_batch.wait_until_complete(timeout=5)
+        assert file_batch.file_batch_status() == batch_status(2)
+        assert not file_batch.file_batch_is_processing()
+    assert mock_get.call_count == 1
+    assert mock_get.call_args.args[0] == 'https://api.mathpix.com/v3/file-batches/batch-1'
+    assert mock_get.call_args.kwargs['session'] is file_batch.auth.session
+
+
+def test_files_iter_yields_every_page(file_batch: FileBatch) -> None:
+    pages = {
+        None: {'results': ['pdf-1', 'pdf-2'], 'cursor': 'page-2', 'has_more': True},
+        'page-2': {'results': ['pdf-3'], 'cursor': '', 'has_more': False},
+    }
+    requested_cursors: List[Optional[str]] = []
+
+    def fake_get(endpoint: str, **kwargs: Any) -> FakeResponse:
+        cursor = endpoint.partition('?cursor=')[2] or None
+        requested_cursors.append(cursor)
+        return FakeResponse(pages[cursor])
+
+    with patch('mpxpy.file_batch.get', side_effect=fake_get):
+        pdf_ids = [pdf.pdf_id for page in file_batch.files_iter() for pdf in page.files]
+    assert pdf_ids == ['pdf-1', 'pdf-2', 'pdf-3']
+    assert requested_cursors == [None, 'page-2']
+
+
+def test_files_pages_carry_auth(file_batch: FileBatch) -> None:
+    page = {'results': ['pdf-1'], 'cursor': '', 'has_more': False}
+    with patch('mpxpy.file_batch.get', return_value=FakeResponse(page)):
+        files = file_batch.files()
+    assert files.files[0].auth is file_batch.auth
@@ -507,6 +507,16 @@ def test_download_legacy_409_is_conversion_incomplete(client: MathpixClient) ->
             file.bytes_result('docx')
 
 
+def test_file_downloads_reuse_auth_session(client: MathpixClient, tmp_path) -> None:
+    file = File(auth=client.auth, file_id='f-1')
+    with patch('mpxpy.file.get') as mock_get:
+        mock_get.return_value = FakeResponse(content=b'PK docx', json_body={})
+        file.to_docx_file(str(tmp_path / 'one.docx'))
+        file.to_docx_file(str(tmp_path / 'two.docx'))
+    assert [call.kwargs['session'] for call in mock_get.call_args_list] == [client.auth.session] * 2
+    assert (tmp_path / 'two.docx').read_bytes() == b'PK docx'
+
+
 # File.delete
 
 def test_file_delete_success(client: MathpixClient) -> None:
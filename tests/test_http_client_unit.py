@@ -0,0 +1,100 @@
+"""Unit tests for the optional httpx HTTP/2 transport.
+
+Requests are served by an httpx.MockTransport; no network access is required.
+"""
+import asyncio
+import json
+from typing import List
+from unittest.mock import patch
+import pytest
+import requests
+from mpxpy import http_client
+from mpxpy.async_request_handler import create_session
+from mpxpy.auth import Auth
+from mpxpy.conversion import Conversion
+from mpxpy.errors import MathpixClientError
+
+httpx = pytest.importorskip('httpx')
+
+COMPLETED_STATUS = {'status': 'completed', 'conversion_status': {'docx': {'status': 'completed'}}}
+
+
+def handler(request: 'httpx.Request') -> 'httpx.Response':
+    if request.url.path.endswith('.docx'):
+        return httpx.Response(200, content=b'docx bytes')
+    if request.url.path.endswith('.md'):
+        return httpx.Response(404)
+    return httpx.Response(200, json=COMPLETED_STATUS)
+
+
+@pytest.fixture
+def mock_client(monkeypatch) -> List['httpx.Request']:
+    sent: List[httpx.Request] = []
+
+    def recording_handler(request: 'httpx.Request') -> 'httpx.Response':
+        sent.append(request)
+        return handler(request)
+
+    monkeypatch.setenv('MPXPY_HTTPX', '1')
+    monkeypatch.setattr(http_client, '_client', httpx.Client(transport=httpx.MockTransport(recording_handler)))
+    return sent
+
+
+@pytest.fixture
+def conversion() -> Conversion:
+    auth = Auth(app_id='test-app', app_key='test-key')
+    return Conversion(auth=auth, conversion_id='conversion-1', convert_to_docx=True)
+
+
+def test_requests_go_through_httpx_when_enabled(conversion: Conversion, mock_client: List['httpx.Request'], tmp_path) -> None:
+    with patch.object(requests.Session, 'request') as session_request:
+        assert conversion.conversion_status() == COMPLETED_STATUS
+        assert conversion.to_docx_bytes() == b'docx bytes'
+        path = conversion.to_docx_file(path=str(tmp_path / 'result.docx'))
+    session_request.assert_not_called()
+    with open(path, 'rb') as f:
+        assert f.read() == b'docx bytes'
+    assert [request.headers['app_id'] for request in mock_client] == ['test-app'] * 3
+
+
+def test_httpx_responses_behave_like_requests_responses(mock_client: List['httpx.Request']) -> None:
+    response = http_client.request('GET', 'https://api.mathpix.com/v3/converter/conversion-1.md')
+    assert not response.ok
+    with pytest.raises(requests.exceptions.HTTPError):
+        response.raise_for_status()
+
+
+def test_unsupported_arguments_fall_back_to_requests(conversion: Conversion, mock_client: List['httpx.Request']) -> None:
+    conversion.request_options = {'verify': False}
+    fake_response = requests.Response()
+    fake_response.status_code = 200
+    fake_response._content = json.dumps(COMPLETED_STATUS).encode()
+    with patch.object(requests.Session, 'request', return_value=fake_response) as session_request:
+        assert conversion.conversion_status() == COMPLETED_STATUS
+    assert session_request.call_args.kwargs['verify'] is False
+    assert mock_client == []
+
+
+def test_transport_errors_raise_client_errors(conversion: Conversion, monkeypatch) -> None:
+    def failing_handler(request: 'httpx.Request') -> 'httpx.Response':
+        raise httpx.ConnectError('connection refused', request=request)
+
+    monkeypatch.setenv('MPXPY_HTTPX', '1')
+    monkeypatch.setattr(http_client, '_client', httpx.Client(transport=httpx.MockTransport(failing_handler)))
+    with pytest.raises(MathpixClientError, match='Connection error'):
+        conversion.conversion_status()
+
+
+def test_async_polling_uses_httpx_async_client(conversion: Conversion, monkeypatch) -> None:
+    monkeypatch.setenv('MPXPY_HTTPX', '1')
+
+    async def wait() -> bool:
+        async with create_session() as async_client:
+            assert isinstance(async_client, httpx.AsyncClient)
+        async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        try:
+            return await conversion.wait_until_complete_async(timeout=5, session=async_client)
+        finally:
+            await async_client.aclose()
+
+    assert asyncio.run(wait()) is True
@@ -0,0 +1,62 @@
+"""Unit tests for Image result handling.
+
+These tests mock the request layer; no network access is required.
+"""
+import json
+from typing import Any, Dict
+from unittest.mock import patch
+import pytest
+from mpxpy.auth import Auth
+from mpxpy.image import Image
+
+
+class FakeResponse:
+    def __init__(self, json_body: Dict[str, Any]) -> None:
+        self._json_body: Dict[str, Any] = json_body
+        self.content: bytes = json.dumps(json_body).encode()
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> Dict[str, Any]:
+        return self._json_body
+
+
+def ocr_results() -> Dict[str, Any]:
+    return {'ocr_results': [{
+        'request_id': 'image-1',
+        'image_id': 'image-1',
+        'result': {'text': '$x^2$', 'line_data': [{'type': 'math'}]},
+    }]}
+
+
+@pytest.fixture
+def async_image() -> Image:
+    auth = Auth(app_id='test-app', app_key='test-key')
+    return Image(auth=auth, request_id='image-1', result={'request_id': 'image-1'}, url='https://example.com/image.png',
+                 include_line_data=True, is_async=True)
+
+
+def test_results_fetches_async_result_once(async_image: Image) -> None:
+    with patch('mpxpy.image.get', return_value=FakeResponse(ocr_results())) as mock_get:
+        first = async_image.results()
+        assert async_image.results() is first
+    assert mock_get.call_count == 1
+    assert async_image.mmd() == '$x^2$'
+    assert async_image.lines_json() == [{'type': 'math'}]
+
+
+def test_results_polls_until_async_result_is_available(async_image: Image) -> None:
+    responses = [FakeResponse({'ocr_results': []}), FakeResponse(ocr_results())]
+    with patch('mpxpy.image.get', side_effect=responses) as mock_get, patch('mpxpy.image.time.sleep'):
+        assert async_image.wait_until_complete(timeout=10) is True
+        async_image.results()
+    assert mock_get.call_count == 2
+
+
+def test_results_raises_value_error_for_a_non_json_body(async_image: Image) -> None:
+    response = FakeResponse({})
+    response.content = b'<html>502</html>'
+    with patch('mpxpy.image.get', return_value=response):
+        with pytest.raises(ValueError):
+            async_image.results()
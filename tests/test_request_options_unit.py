@@ -1,8 +1,10 @@
 """Unit tests for v3 request option forwarding and conflict handling."""
 import json
+from typing import Any, Dict
 from unittest.mock import patch
 import pytest
-from mpxpy.errors import ValidationError
+import requests
+from mpxpy.errors import MathpixClientError, ValidationError
 from mpxpy.mathpix_client import MathpixClient
 
 
@@ -11,6 +13,12 @@ def client() -> MathpixClient:
     return MathpixClient(app_id='test-app', app_key='test-key')
 
 
+def sent_form_fields(call) -> Dict[str, Any]:
+    """Form fields of a multipart request, whether or not the body was streamed."""
+    data = call.kwargs['data']
+    return getattr(data, 'fields', data)
+
+
 def test_image_new_sends_documented_and_extra_options(client: MathpixClient, tmp_path) -> None:
     image_path = tmp_path / 'image.png'
     image_path.write_bytes(b'image')
@@ -24,7 +32,7 @@ def test_image_new_sends_documented_and_extra_options(client: MathpixClient, tmp
             enable_document_layout=True,
             extra_options={'future_image_option': 'enabled'},
         )
-    options = json.loads(mock_post.call_args.kwargs['data']['options_json'])
+    options = json.loads(sent_form_fields(mock_post.call_args)['options_json'])
     assert {
         key: options[key] for key in (
             'disable_itemize', 'disable_lstlisting', 'include_page_info',
@@ -39,6 +47,92 @@ def test_image_new_sends_documented_and_extra_options(client: MathpixClient, tmp
     }
 
 
+def test_image_new_sends_only_provided_options(client: MathpixClient) -> None:
+    with patch('mpxpy.mathpix_client.post') as mock_post:
+        mock_post.return_value.json.return_value = {'request_id': 'image-1'}
+        client.image_new(
+            url='https://example.com/image.png',
+            formats=['text', 'data'],
+            data_options={'include_asciimath': True},
+            math_inline_delimiters=('\\(', '\\)'),
+        )
+    assert mock_post.call_args.kwargs['json'] == {
+        'src': 'https://example.com/image.png',
+        'metadata': {'mpxpy': True},
+        'formats': ['text', 'data'],
+        'data_options': {'include_asciimath': True},
+        'math_inline_delimiters': ('\\(', '\\)'),
+    }
+
+
+def test_image_new_streams_file_upload(client: MathpixClient, tmp_path) -> None:
+    pytest.importorskip('requests_toolbelt')
+    image_path = tmp_path / 'image.png'
+    image_path.write_bytes(b'image bytes')
+    with patch('mpxpy.mathpix_client.post') as mock_post:
+        mock_post.return_value.json.return_value = {'request_id': 'image-1'}
+        client.image_new(file_path=str(image_path))
+    kwargs = mock_post.call_args.kwargs
+    assert 'files' not in kwargs
+    assert kwargs['headers']['Content-Type'] == kwargs['data'].content_type
+    assert kwargs['headers']['app_id'] == 'test-app'
+    assert kwargs['data'].fields['file'][0] == 'image.png'
+
+
+def test_pdf_new_streams_file_upload(client: MathpixClient, tmp_path) -> None:
+    pytest.importorskip('requests_toolbelt')
+    pdf_path = tmp_path / 'document.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4')
+    with patch('mpxpy.mathpix_client.post') as mock_post:
+        mock_post.return_value.content = json.dumps({'pdf_id': 'pdf-1'}).encode()
+        client.pdf_new(file_path=str(pdf_path))
+    kwargs = mock_post.call_args.kwargs
+    assert 'files' not in kwargs
+    assert kwargs['headers']['Content-Type'] == kwargs['data'].content_type
+    assert kwargs['data'].fields['file'][0] == 'document.pdf'
+
+
+def test_image_new_uploads_without_requests_toolbelt(client: MathpixClient, tmp_path) -> None:
+    image_path = tmp_path / 'image.png'
+    image_path.write_bytes(b'image bytes')
+    with patch('mpxpy.request_handler.MultipartEncoder', None), patch('mpxpy.mathpix_client.post') as mock_post:
+        mock_post.return_value.json.return_value = {'request_id': 'image-1'}
+        client.image_new(file_path=str(image_path))
+    kwargs = mock_post.call_args.kwargs
+    assert kwargs['files']['file'].name == str(image_path)
+    assert 'options_json' in kwargs['data']
+
+
+@pytest.mark.parametrize('upload_method', ['image_new', 'pdf_new'])
+def test_uploads_reject_missing_files(client: MathpixClient, tmp_path, upload_method: str) -> None:
+    with patch('mpxpy.mathpix_client.post') as mock_post:
+        with pytest.raises(FileNotFoundError):
+            getattr(client, upload_method)(file_path=str(tmp_path / 'missing.png'))
+        with pytest.raises(FileNotFoundError):
+            getattr(client, upload_method)(file_path=str(tmp_path))
+    mock_post.assert_not_called()
+
+
+def test_uploads_reject_directories_on_windows(client: MathpixClient, tmp_path) -> None:
+    # Opening a directory raises PermissionError on Windows
+    with patch('mpxpy.mathpix_client.open', side_effect=PermissionError, create=True):
+        with pytest.raises(FileNotFoundError):
+            client.pdf_new(file_path=str(tmp_path))
+        with pytest.raises(PermissionError):
+            client.pdf_new(file_path=str(tmp_path / 'locked.pdf'))
+
+
+@pytest.mark.parametrize('option', [
+    'confidence_threshold', 'confidence_rate_threshold', 'auto_rotate_confidence_threshold',
+])
+def test_image_new_rejects_out_of_range_thresholds(client: MathpixClient, option: str) -> None:
+    with patch('mpxpy.mathpix_client.post') as mock_post:
+        for value in (-0.1, 1.5):
+            with pytest.raises(ValidationError, match=option):
+                client.image_new(url='https://example.com/image.png', **{option: value})
+    mock_post.assert_not_called()
+
+
 def test_image_new_rejects_modeled_extra_options(client: MathpixClient) -> None:
     for key in ('src', 'metadata', 'callback', 'disable_itemize'):
         with pytest.raises(ValidationError):
@@ -49,7 +143,7 @@ def test_pdf_new_sends_documented_and_extra_options(client: MathpixClient, tmp_p
     pdf_path = tmp_path / 'document.pdf'
     pdf_path.write_bytes(b'%PDF-1.4')
     with patch('mpxpy.mathpix_client.post') as mock_post:
-        mock_post.return_value.json.return_value = {'pdf_id': 'pdf-1'}
+        mock_post.return_value.content = json.dumps({'pdf_id': 'pdf-1'}).encode()
         client.pdf_new(
             file_path=str(pdf_path),
             disable_itemize=False,
@@ -59,7 +153,7 @@ def test_pdf_new_sends_documented_and_extra_options(client: MathpixClient, tmp_p
             conversion_options={'docx': {'font_size': 12}},
             extra_options={'future_pdf_option': 'enabled'},
         )
-    options = json.loads(mock_post.call_args.kwargs['data']['options_json'])
+    options = json.loads(sent_form_fields(mock_post.call_args)['options_json'])
     assert {
         key: options[key] for key in (
             'disable_itemize', 'disable_lstlisting', 'include_page_info',
@@ -75,6 +169,15 @@ def test_pdf_new_sends_documented_and_extra_options(client: MathpixClient, tmp_p
     }
 
 
+def test_pdf_new_wraps_undecodable_response(client: MathpixClient, tmp_path) -> None:
+    pdf_path = tmp_path / 'document.pdf'
+    pdf_path.write_bytes(b'%PDF-1.4')
+    with patch('mpxpy.mathpix_client.post') as mock_post:
+        mock_post.return_value.content = b'<html>Bad Gateway</html>'
+        with pytest.raises(MathpixClientError):
+            client.pdf_new(file_path=str(pdf_path))
+
+
 def test_pdf_new_rejects_modeled_extra_options(client: MathpixClient) -> None:
     for key in (
             'url', 'metadata', 'conversion_formats', 'file_batch_id', 'webhook_url',
@@ -87,14 +190,15 @@ def test_pdf_new_rejects_modeled_extra_options(client: MathpixClient) -> None:
 
 def test_conversion_new_sends_documented_and_extra_options(client: MathpixClient) -> None:
     with patch('mpxpy.mathpix_client.post') as mock_post:
-        mock_post.return_value.json.return_value = {'conversion_id': 'conversion-1'}
+        mock_post.return_value.content = json.dumps({'conversion_id': 'conversion-1'}).encode()
         client.conversion_new(
             mmd='# Document',
             convert_to_docx=True,
             conversion_options={'docx': {'font_size': 12}},
             extra_options={'metadata': {'customer_id': 'customer-1'}},
         )
-    assert mock_post.call_args.kwargs['json'] == {
+    assert mock_post.call_args.kwargs['headers']['Content-Type'] == 'application/json'
+    assert json.loads(mock_post.call_args.kwargs['data']) == {
         'mmd': '# Document',
         'formats': {'docx': True},
         'conversion_options': {'docx': {'font_size': 12}},
@@ -102,6 +206,48 @@ def test_conversion_new_sends_documented_and_extra_options(client: MathpixClient
     }
 
 
+def test_conversion_new_sends_msgpack_body_when_enabled() -> None:
+    msgpack = pytest.importorskip('msgpack')
+    client = MathpixClient(app_id='test-app', app_key='test-key', api_url='https://api.example.com', encoding='msgpack')
+    with patch('mpxpy.mathpix_client.post') as mock_post:
+        mock_post.return_value.headers = {'Content-Type': 'application/msgpack'}
+        mock_post.return_value.content = msgpack.packb({'conversion_id': 'conversion-1'})
+        conversion = client.conversion_new(mmd='$\\frac{a}{b}$', convert_to_docx=True)
+    assert conversion.conversion_id == 'conversion-1'
+    assert mock_post.call_args.kwargs['headers']['Content-Type'] == 'application/msgpack'
+    assert msgpack.unpackb(mock_post.call_args.kwargs['data'], raw=False) == {
+        'mmd': '$\\frac{a}{b}$',
+        'formats': {'docx': True},
+    }
+
+
+def test_msgpack_encoding_falls_back_to_json_on_production_api() -> None:
+    pytest.importorskip('msgpack')
+    client = MathpixClient(app_id='test-app', app_key='test-key', api_url='https://api.mathpix.com', encoding='msgpack')
+    assert client.encoding == 'json'
+
+
+def test_client_rejects_unknown_encoding() -> None:
+    with pytest.raises(ValidationError):
+        MathpixClient(app_id='test-app', app_key='test-key', encoding='xml')
+
+
+def test_client_requests_reuse_auth_session(client: MathpixClient) -> None:
+    with patch('mpxpy.mathpix_client.post') as mock_post:
+        mock_post.return_value.content = json.dumps({'pdf_id': 'pdf-1', 'file_batch_id': 'batch-1', 'conversion_id': 'conversion-1'}).encode()
+        client.pdf_new(url='https://example.com/document.pdf')
+        client.file_batch_new()
+        client.conversion_new(mmd='# Document', convert_to_docx=True)
+    sessions = [call.kwargs['session'] for call in mock_post.call_args_list]
+    assert sessions == [client.auth.session] * 3
+    assert client.auth.session.headers['Connection'] == 'keep-alive'
+
+
+def test_auth_session_is_created_with_the_client(client: MathpixClient) -> None:
+    # Built in Auth.__init__, so threads sharing the client never race to create it
+    assert isinstance(vars(client.auth)['session'], requests.Session)
+
+
 def test_conversion_new_rejects_modeled_extra_options(client: MathpixClient) -> None:
     for key in ('mmd', 'formats', 'conversion_options'):
         with pytest.raises(ValidationError):